@@ -1,6 +1,20 @@
+# App-wide threading policy: keep OpenCV / OpenMP / MKL single-threaded so
+# they don't oversubscribe the cores MediaPipe's TFLite runtime uses.
+# This must run before numpy / cv2 / mediapipe are first imported; don't
+# re-enable OpenCV threading elsewhere.
+import os
+
+os.environ.setdefault("OMP_NUM_THREADS", "1")
+os.environ.setdefault("MKL_NUM_THREADS", "1")
+
+import cv2
+
+cv2.setNumThreads(1)
+
 from .gesture_interface import GestureRecognizerInterface, GestureResult
 from .recognizer_mediapipe import GestureRecognizerMP
 from .recognizer_hybrid import HybridGestureRecognizer
+from .recognizer_process import ProcessRecognizer
 from .recognizer_factory import (
     RecognizerFactory,
     RecognizerType,
@@ -17,6 +31,7 @@ __all__ = [
     # Implementations
     "GestureRecognizerMP",
     "HybridGestureRecognizer",
+    "ProcessRecognizer",
     # Factory & Singleton
     "RecognizerFactory",
     "RecognizerType",
@@ -1,9 +1,12 @@
+import queue
+import threading
 import time
-import cv2
 
 from PySide6.QtCore import QThread
 
+from app.core.camera_broker import FrameBroker
 from app.core.controller import GameController
+from app.core.performance import PerformanceTracker
 from app.core.recognizer_factory import get_recognizer
 
 
@@ -11,6 +14,9 @@ class GestureBackgroundWorker(QThread):
     """
     Runs gesture recognition in the background WITHOUT UI.
     When a gesture is detected, presses the correct key for the selected profile.
+
+    Pipeline: capture thread -> run() (inference) -> action thread (keypress),
+    so a slow keypress never delays the next frame's inference.
     """
 
     def __init__(self, profile="Subway Surfers", parent=None):
@@ -24,6 +30,13 @@ class GestureBackgroundWorker(QThread):
         # This ensures we always use the current singleton instance
         self.recognizer = None
 
+        self._broker = FrameBroker.get_instance()
+        self._frame_seq = 0
+        self._result_q = queue.Queue(maxsize=2)
+
+        self.perf = PerformanceTracker()
+        self.stats_interval_s = 5.0
+
         self.last_action = "IDLE"
         self.cooldown_s = 0.25
         self.last_press_time = 0.0
@@ -31,38 +44,89 @@ class GestureBackgroundWorker(QThread):
     def stop(self):
         self.running = False
 
+    def get_stage_times(self):
+        """EWMA latency per pipeline stage (cap / infer / act), in seconds."""
+        # Capture runs in the shared broker, which tracks its own stage
+        return {**self._broker.perf.get_stage_times(), **self.perf.get_stage_times()}
+
+    def get_queue_depths(self):
+        """Items waiting between pipeline stages."""
+        return {
+            "frame": int(self._broker.latest_seq() != self._frame_seq),
+            "result": self._result_q.qsize(),
+        }
+
+    def _log_stats(self):
+        stages = " ".join(
+            f"{name}={t * 1000:.1f}ms" for name, t in self.get_stage_times().items()
+        )
+        depths = " ".join(f"{name}={n}" for name, n in self.get_queue_depths().items())
+        print(f"[BackgroundWorker] fps={self.perf.get_fps():.1f} {stages} | queues: {depths}")
+
     def run(self):
         # Get the current singleton recognizer at run time
         self.recognizer = get_recognizer()
-        
-        cap = cv2.VideoCapture(0)
-        cap.set(cv2.CAP_PROP_FRAME_WIDTH, 1280)
-        cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 720)
 
-        if not cap.isOpened():
+        # The camera is shared with the launcher's UI worker. No preview is
+        # shown, so the broker's small stream is enough: MediaPipe resizes
+        # internally and landmarks are normalized, so results are unchanged
+        broker = self._broker
+        if not broker.acquire():
             print("❌ BackgroundWorker: Camera could not open")
+            self.controller.close()
             return
 
+        action_thread = threading.Thread(target=self._action_loop, daemon=True)
+        action_thread.start()
+
+        last_stats = time.monotonic()
+
         try:
             while self.running:
-                ret, frame = cap.read()
-                if not ret:
-                    time.sleep(0.01)
+                seq, frame = broker.wait_frame(self._frame_seq)
+                if frame is None:
                     continue
+                self._frame_seq = seq
 
-                result = self.recognizer.process(frame)
-                action = result.action
-
-                now = time.time()
+                t = time.perf_counter()
+                result = self.recognizer.process(frame, needs_frame=False)
+                self.perf.record_stage("infer", t)
+                self.perf.record_frame()
 
-                # ✅ Trigger ONLY on IDLE -> ACTION (edge detection)
-                if action != "IDLE" and self.last_action == "IDLE":
-                    if (now - self.last_press_time) >= self.cooldown_s:
-                        self.controller.execute_action(action, self.profile)
-                        self.last_press_time = now
+                # Blocking put: dropping a result could merge two
+                # IDLE -> ACTION edges and lose a keypress. The action
+                # thread never blocks on input, so this rarely waits.
+                self._result_q.put(result)
 
-                self.last_action = action
-                time.sleep(0.005)
+                now = time.monotonic()
+                if now - last_stats >= self.stats_interval_s:
+                    self._log_stats()
+                    last_stats = now
 
         finally:
-            cap.release()
\ No newline at end of file
+            broker.release()
+
+            # None tells the action thread to exit
+            self._result_q.put(None)
+            action_thread.join()
+            self.controller.close()
+
+    def _action_loop(self):
+        """Consume recognition results and press keys."""
+        while True:
+            result = self._result_q.get()
+            if result is None:
+                break
+
+            action = result.action
+            now = time.monotonic()
+
+            # ✅ Trigger ONLY on IDLE -> ACTION (edge detection)
+            if action != "IDLE" and self.last_action == "IDLE":
+                if (now - self.last_press_time) >= self.cooldown_s:
+                    t = time.perf_counter()
+                    self.controller.execute_action(action, self.profile)
+                    self.perf.record_stage("act", t)
+                    self.last_press_time = now
+
+            self.last_action = action
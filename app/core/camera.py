@@ -0,0 +1,92 @@
+"""
+Camera capture helpers.
+
+Opens the webcam with the platform's native backend and low-latency
+settings (MJPEG, single-frame driver buffer). FrameBroker runs the
+grabber thread that always hands out the newest frame.
+"""
+
+import sys
+
+import cv2
+
+
+def _platform_backend() -> int:
+    """Pick the native capture backend for this OS."""
+    if sys.platform.startswith("linux"):
+        # The default may pick GStreamer, which adds pipeline latency
+        return cv2.CAP_V4L2
+    if sys.platform == "win32":
+        return cv2.CAP_DSHOW
+    if sys.platform == "darwin":
+        return cv2.CAP_AVFOUNDATION
+    return cv2.CAP_ANY
+
+
+def fourcc_to_str(fourcc: float) -> str:
+    """Decode a CAP_PROP_FOURCC value into its four-character code."""
+    code = int(fourcc)
+    return "".join(chr((code >> (8 * i)) & 0xFF) for i in range(4))
+
+
+def jpeg_codec() -> str:
+    """
+    The JPEG library OpenCV was built with (it decodes MJPEG in read()).
+    The opencv-python wheels bundle libjpeg-turbo, whose SIMD decoder is
+    what makes requesting MJPEG a net CPU win.
+    """
+    for line in cv2.getBuildInformation().splitlines():
+        name, _, value = line.strip().partition(":")
+        if name == "JPEG":
+            return value.strip()
+    return "unknown"
+
+
+def open_camera(
+    index: int = 0,
+    width: int = 640,
+    height: int = 480,
+    mjpeg: bool = True,
+) -> cv2.VideoCapture:
+    """
+    Open a camera for low-latency capture.
+
+    Args:
+        index: Camera index
+        width: Requested frame width. Recognizers only use normalized
+            landmarks and MediaPipe runs at ~256px, so a small capture
+            saves USB bandwidth, decode and conversion work for nothing
+        height: Requested frame height
+        mjpeg: Request MJPEG instead of the (much larger) YUYV stream
+
+    Returns:
+        The VideoCapture; callers must check isOpened()
+    """
+    cap = cv2.VideoCapture(index, _platform_backend())
+    if not cap.isOpened():
+        # Native backend unavailable (e.g. OpenCV built without it)
+        cap = cv2.VideoCapture(index)
+    if not cap.isOpened():
+        return cap
+
+    if mjpeg:
+        cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*"MJPG"))
+    cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+
+    # Keep the driver queue short so grab() always returns a fresh frame
+    if not cap.set(cv2.CAP_PROP_BUFFERSIZE, 1):
+        print("[Camera] ⚠ Backend ignored CAP_PROP_BUFFERSIZE=1, frames may lag")
+
+    fourcc = fourcc_to_str(cap.get(cv2.CAP_PROP_FOURCC))
+    print(
+        f"[Camera] Opened #{index} via {cap.getBackendName()}: "
+        f"{int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))}x{int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))} "
+        f"{fourcc}"
+    )
+    if fourcc == "MJPG":
+        codec = jpeg_codec()
+        if "turbo" not in codec:
+            print(f"[Camera] ⚠ OpenCV decodes MJPEG with '{codec}', not libjpeg-turbo")
+    return cap
+
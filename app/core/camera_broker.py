@@ -0,0 +1,159 @@
+"""
+Shared camera broker.
+
+The launcher's UI-navigation worker runs for the whole session, and the
+game worker runs alongside it while a game is open. Opening the camera
+twice either fails outright or splits the hardware frame rate between
+two handles, so both workers read from one FrameBroker instead: one
+capture, one grab thread, any number of readers.
+
+Usage:
+    broker = FrameBroker.get_instance()
+    if broker.acquire():
+        seq = 0
+        seq, frame = broker.wait_frame(seq)
+        ...
+        broker.release()
+"""
+
+import threading
+import time
+from typing import Optional
+
+import numpy as np
+
+from .camera import open_camera
+from .performance import PerformanceTracker
+
+
+class FrameBroker:
+    """
+    Owns the VideoCapture and publishes the newest frame to all readers.
+
+    The camera is opened by the first acquire() and closed by the last
+    release(). Published frames are shared between readers and must be
+    treated as read-only.
+    """
+
+    _instance: Optional["FrameBroker"] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, index: int = 0, width: int = 640, height: int = 360):
+        """
+        Args:
+            index: Camera index
+            width: Requested frame width
+            height: Requested frame height
+        """
+        self.index = index
+        self.width = width
+        self.height = height
+
+        # Tracks the "cap" stage (grab + decode) for the readers' stats
+        self.perf = PerformanceTracker()
+
+        self._ref_lock = threading.Lock()
+        self._refs = 0
+        self._cap = None
+        self._thread: Optional[threading.Thread] = None
+
+        self._cond = threading.Condition()
+        self._running = False
+        self._frame: Optional[np.ndarray] = None
+        self._seq = 0
+
+    @classmethod
+    def get_instance(cls) -> "FrameBroker":
+        """Get the process-wide broker, creating it on first use."""
+        instance = cls._instance
+        if instance is not None:
+            return instance
+
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    def acquire(self) -> bool:
+        """
+        Register a reader, opening the camera if this is the first one.
+
+        Returns:
+            True if the camera is open; on False the caller must not release()
+        """
+        with self._ref_lock:
+            if self._refs == 0:
+                cap = open_camera(self.index, width=self.width, height=self.height)
+                if not cap.isOpened():
+                    return False
+
+                self._cap = cap
+                with self._cond:
+                    self._running = True
+                    self._frame = None
+                self._thread = threading.Thread(target=self._grab_loop, daemon=True)
+                self._thread.start()
+
+            self._refs += 1
+            return True
+
+    def release(self) -> None:
+        """Unregister a reader, closing the camera when none are left."""
+        with self._ref_lock:
+            if self._refs == 0:
+                return
+            self._refs -= 1
+            if self._refs > 0:
+                return
+
+            with self._cond:
+                self._running = False
+                self._cond.notify_all()
+            self._thread.join()
+            self._thread = None
+            self._cap.release()
+            self._cap = None
+
+    def wait_frame(
+        self, last_seq: int, timeout: float = 0.1
+    ) -> tuple[int, Optional[np.ndarray]]:
+        """
+        Block until a frame newer than last_seq is published.
+
+        Args:
+            last_seq: Sequence number of the last frame this reader saw (0 initially)
+            timeout: Max seconds to wait
+
+        Returns:
+            (seq, frame), or (last_seq, None) on timeout or after the camera closed
+        """
+        with self._cond:
+            # _frame is None right after a reopen, while _seq carries over
+            # from the previous session; wait for the first frame then too
+            if (self._seq == last_seq or self._frame is None) and self._running:
+                self._cond.wait(timeout)
+            if self._seq == last_seq or self._frame is None:
+                return last_seq, None
+            return self._seq, self._frame
+
+    def latest_seq(self) -> int:
+        """Sequence number of the newest published frame."""
+        return self._seq
+
+    def _grab_loop(self) -> None:
+        cap = self._cap
+        while self._running:
+            t = time.perf_counter()
+            if not cap.grab():
+                time.sleep(0.01)
+                continue
+
+            ret, frame = cap.retrieve()
+            if not ret:
+                continue
+            self.perf.record_stage("cap", t)
+
+            with self._cond:
+                self._frame = frame
+                self._seq += 1
+                self._cond.notify_all()
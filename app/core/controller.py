@@ -1,47 +1,76 @@
 from pynput.keyboard import Key, Controller as KeyController
+import queue
+import threading
 import time
 
 
+# Game profile -> (action -> key)
+_PROFILE_KEYMAPS = {
+    "Subway Surfers": {
+        "LEFT": Key.left,
+        "RIGHT": Key.right,
+        "JUMP": Key.up,
+        "DUCK": Key.down,
+        "SPACE": Key.space,   # ✅ NEW
+    },
+    "Temple Run": {
+        "LEFT": "a",
+        "RIGHT": "d",
+        "JUMP": "w",
+        "DUCK": "s",
+        "SPACE": Key.space,   # ✅ NEW
+    },
+}
+
+
 class GameController:
     def __init__(self):
         self.keyboard = KeyController()
         self.cooldown = 0.12
+        # 0 = instantaneous tap; browser games act on the keydown event.
+        # Set > 0 for games that need the key held.
+        self.hold_s = 0.0
         self.last_press_time = 0.0
 
+        # Key presses are sent from a dedicated thread so that execute_action()
+        # never blocks its caller (for the hold time, or on the OS input API)
+        self._key_q = queue.Queue()
+        self._key_thread = threading.Thread(target=self._key_loop, daemon=True)
+        self._key_thread.start()
+
     def execute_action(self, action, profile):
-        keymap = self._get_profile_keymap(profile)
-        if action not in keymap:
+        keymap = _PROFILE_KEYMAPS.get(profile)
+        if keymap is None:
+            return
+        key = keymap.get(action)
+        if key is None:
             return
 
-        now = time.time()
+        now = time.monotonic()
         if now - self.last_press_time < self.cooldown:
             return
 
-        key = keymap[action]
-        try:
-            self.keyboard.press(key)
-            time.sleep(0.05)
-            self.keyboard.release(key)
-            self.last_press_time = now
-        except Exception as e:
-            print(f"[Controller] Error pressing key: {e}")
-
-    def _get_profile_keymap(self, profile):
-        if profile == "Subway Surfers":
-            return {
-                "LEFT": Key.left,
-                "RIGHT": Key.right,
-                "JUMP": Key.up,
-                "DUCK": Key.down,
-                "SPACE": Key.space,   # ✅ NEW
-            }
-        elif profile == "Temple Run":
-            return {
-                "LEFT": "a",
-                "RIGHT": "d",
-                "JUMP": "w",
-                "DUCK": "s",
-                "SPACE": Key.space,   # ✅ NEW
-            }
-        else:
-            return {}
+        self._key_q.put_nowait((key, self.hold_s))
+        self.last_press_time = now
+
+    def close(self):
+        """Stop the key thread once queued presses are sent."""
+        # None tells the key thread to exit
+        self._key_q.put(None)
+        self._key_thread.join()
+
+    def _key_loop(self):
+        while True:
+            item = self._key_q.get()
+            if item is None:
+                break
+            key, hold = item
+            try:
+                if hold > 0:
+                    self.keyboard.press(key)
+                    time.sleep(hold)
+                    self.keyboard.release(key)
+                else:
+                    self.keyboard.tap(key)
+            except Exception as e:
+                print(f"[Controller] Error pressing key: {e}")
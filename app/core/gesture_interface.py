@@ -11,19 +11,22 @@ from typing import Any, Optional
 import numpy as np
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GestureResult:
     """
     Standardized result from gesture recognition.
     
     Attributes:
-        frame: The processed frame (possibly mirrored)
+        frame: The input frame as captured (recognizers never mirror it;
+               mirroring for display is up to the UI layer), or None if
+               the caller asked for a result without the frame
         action: The detected action ("LEFT", "RIGHT", "JUMP", "DUCK", "SPACE", "IDLE")
         raw_label: The raw gesture label from the recognizer (e.g., "Victory", "Closed_Fist")
         confidence: Confidence score (0.0 - 1.0)
-        landmarks: Hand landmarks for visualization (format depends on implementation)
+        landmarks: Hand landmarks for visualization, in the coordinates of
+                   `frame` as captured (format depends on implementation)
     """
-    frame: np.ndarray
+    frame: Optional[np.ndarray]
     action: str
     raw_label: Optional[str]
     confidence: float
@@ -39,12 +42,14 @@ class GestureRecognizerInterface(ABC):
     """
     
     @abstractmethod
-    def process(self, frame_bgr: np.ndarray) -> GestureResult:
+    def process(self, frame_bgr: np.ndarray, needs_frame: bool = True) -> GestureResult:
         """
         Process a single BGR frame and detect gestures.
         
         Args:
             frame_bgr: Input frame in BGR format (as returned by cv2.VideoCapture)
+            needs_frame: False for headless callers that never draw; the
+                         result then carries no frame and no landmarks
             
         Returns:
             GestureResult containing the processed frame, detected action,
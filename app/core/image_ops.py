@@ -0,0 +1,153 @@
+"""
+Frame pre-processing and landmark kernels.
+
+downscale_to_fit() shrinks frames into the recognizers' inference size,
+reusing the caller's output buffer.
+
+landmarks_to_pixels() converts normalized hand landmarks to int32 pixel
+coordinates for drawing, JIT-compiled when numba is installed.
+
+draw_hand_skeleton() draws the 21-point hand skeleton shared by the
+recognizers and the test UI.
+"""
+
+import cv2
+import numpy as np
+from typing import Any, Optional, Sequence
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional
+    njit = None
+
+
+# Skeleton drawn as landmark chains: each finger from the wrist, plus the palm
+HAND_CHAINS = [
+    np.array(chain, dtype=np.int32)
+    for chain in (
+        (0, 1, 2, 3, 4),        # Thumb
+        (0, 5, 6, 7, 8),        # Index
+        (0, 9, 10, 11, 12),     # Middle
+        (0, 13, 14, 15, 16),    # Ring
+        (0, 17, 18, 19, 20),    # Pinky
+        (5, 9, 13, 17),         # Palm
+    )
+]
+# Default per-landmark color / radius, highlighting the index tip
+_POINT_COLORS = tuple((0, 255, 255) if i == 8 else (255, 0, 255) for i in range(21))
+_POINT_RADII = tuple(8 if i == 8 else 4 for i in range(21))
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _to_pixels_nb(xy, w, h, mirror, out):
+        for i in range(xy.shape[0]):
+            x = xy[i, 0] * w
+            out[i, 0] = int(w - x) if mirror else int(x)
+            out[i, 1] = int(xy[i, 1] * h)
+else:
+    _to_pixels_nb = None
+
+
+def downscale_to_fit(
+    src: np.ndarray,
+    box: Optional[tuple[int, int]],
+    dst: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Shrink a frame to fit inside box, keeping its aspect ratio.
+
+    Args:
+        src: HxWx3 uint8 frame
+        box: (width, height) to fit into; None disables downscaling
+        dst: Buffer from the previous call, reused if its size still matches
+
+    Returns:
+        src itself if it already fits, else the resized frame (dst or a new
+        buffer the caller should keep for the next call)
+    """
+    if box is None:
+        return src
+    h, w = src.shape[:2]
+    max_w, max_h = box
+    scale = min(max_w / w, max_h / h)
+    if scale >= 1.0:
+        return src
+
+    size = (max(1, round(w * scale)), max(1, round(h * scale)))
+    if dst is None or dst.shape[1::-1] != size:
+        dst = np.empty((size[1], size[0], 3), dtype=np.uint8)
+    return cv2.resize(src, size, dst=dst, interpolation=cv2.INTER_AREA)
+
+
+def landmarks_to_pixels(landmarks: Any, w: int, h: int, mirror: bool = False) -> np.ndarray:
+    """
+    Convert normalized landmarks to pixel coordinates.
+
+    Args:
+        landmarks: Sequence of landmarks with .x/.y, or an (N, 2+) array
+        w: Frame width
+        h: Frame height
+        mirror: Flip x to match a horizontally flipped frame
+
+    Returns:
+        (N, 2) int32 array of (x, y) pixels
+    """
+    if isinstance(landmarks, np.ndarray):
+        xy = landmarks
+    else:
+        xy = np.fromiter(
+            (v for lm in landmarks for v in (lm.x, lm.y)),
+            dtype=np.float32,
+            count=2 * len(landmarks),
+        ).reshape(-1, 2)
+
+    if _to_pixels_nb is not None:
+        out = np.empty((xy.shape[0], 2), dtype=np.int32)
+        _to_pixels_nb(xy, w, h, mirror, out)
+        return out
+
+    px = xy[:, :2] * np.array((w, h), dtype=np.float32)
+    if mirror:
+        px[:, 0] = w - px[:, 0]
+    return px.astype(np.int32)
+
+
+def draw_hand_skeleton(
+    frame: np.ndarray,
+    landmarks: Any,
+    mirror: bool = False,
+    line_color: tuple[int, int, int] = (0, 255, 0),
+    point_colors: Sequence[tuple[int, int, int]] = _POINT_COLORS,
+    point_radii: Sequence[int] = _POINT_RADII,
+) -> np.ndarray:
+    """
+    Draw a 21-point hand skeleton in place.
+
+    Args:
+        frame: BGR frame to draw on
+        landmarks: Normalized landmarks with .x/.y, or a (21, 2+) array
+        mirror: Flip x to match a horizontally flipped frame
+        line_color: BGR color of the finger / palm chains
+        point_colors: BGR color per landmark
+        point_radii: Radius per landmark
+
+    Returns:
+        frame
+    """
+    h, w = frame.shape[:2]
+    pts = landmarks_to_pixels(landmarks, w, h, mirror)
+
+    # All finger / palm chains in a single OpenCV call
+    cv2.polylines(
+        frame,
+        [pts[chain].reshape(-1, 1, 2) for chain in HAND_CHAINS],
+        False,
+        line_color,
+        2,
+    )
+
+    for i, point in enumerate(pts.tolist()):
+        cv2.circle(frame, point, point_radii[i], point_colors[i], -1)
+
+    return frame
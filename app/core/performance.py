@@ -1,22 +1,33 @@
+import collections
 import time
 
 
 class PerformanceTracker:
-    def __init__(self):
-        self.last_time = time.time()
-        self.frame_count = 0
-        self.fps = 0.0
+    def __init__(self, window=120):
+        # Timestamps of the most recent frames; FPS is a sliding window over them
+        self._stamps = collections.deque(maxlen=window)
+        # Per-stage latency EWMA in seconds, keyed by stage name
+        self.stage_times: dict[str, float] = {}
 
     def record_frame(self):
-        self.frame_count += 1
-        now = time.time()
-        if now - self.last_time >= 1.0:
-            self.fps = self.frame_count / (now - self.last_time)
-            self.last_time = now
-            self.frame_count = 0
+        self._stamps.append(time.perf_counter())
 
     def get_fps(self):
-        return self.fps
+        stamps = self._stamps
+        if len(stamps) < 2:
+            return 0.0
+        span = stamps[-1] - stamps[0]
+        return (len(stamps) - 1) / span if span > 0 else 0.0
+
+    def record_stage(self, name, start):
+        """Fold the time since start (a time.perf_counter() value) into the stage EWMA."""
+        elapsed = time.perf_counter() - start
+        prev = self.stage_times.get(name)
+        self.stage_times[name] = elapsed if prev is None else 0.9 * prev + 0.1 * elapsed
+
+    def get_stage_times(self):
+        return dict(self.stage_times)
 
     def latency_ms(self, start_time):
-        return (time.time() - start_time) * 1000
+        """Milliseconds since start_time, which must come from time.monotonic()."""
+        return (time.monotonic() - start_time) * 1000
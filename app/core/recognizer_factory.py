@@ -6,12 +6,14 @@ plus a singleton manager for shared access across the app.
 """
 
 from enum import Enum, auto
-from typing import Optional
+from typing import Callable, Optional
+import sys
 import threading
 
 from .gesture_interface import GestureRecognizerInterface
 from .recognizer_mediapipe import GestureRecognizerMP
 from .recognizer_hybrid import HybridGestureRecognizer
+from .recognizer_process import ProcessRecognizer
 from .paths import asset_path
 
 
@@ -29,6 +31,32 @@ class RecognizerType(Enum):
     HYBRID_POSE = "HYBRID_POSE"
 
 
+def _make_mediapipe(model_path, min_score, mirror_view, **kwargs):
+    if model_path is None:
+        model_path = asset_path("gesture_recognizer.task")
+    return GestureRecognizerMP(
+        model_path=model_path,
+        min_score=min_score,
+        mirror_view=mirror_view,
+        **kwargs,
+    )
+
+
+def _make_hybrid(model_path, min_score, mirror_view, **kwargs):
+    return HybridGestureRecognizer(
+        min_detection_confidence=min_score,
+        mirror_view=mirror_view,
+        **kwargs,
+    )
+
+
+# Recognizer type -> constructor taking (model_path, min_score, mirror_view, **kwargs)
+_FACTORIES: dict[RecognizerType, Callable[..., GestureRecognizerInterface]] = {
+    RecognizerType.MEDIAPIPE_TASKS: _make_mediapipe,
+    RecognizerType.HYBRID_POSE: _make_hybrid,
+}
+
+
 class RecognizerFactory:
     """
     Factory for creating gesture recognizer instances.
@@ -45,6 +73,7 @@ class RecognizerFactory:
         model_path: Optional[str] = None,
         min_score: float = 0.60,
         mirror_view: bool = True,
+        out_of_process: bool = False,
         **kwargs,
     ) -> GestureRecognizerInterface:
         """
@@ -54,7 +83,11 @@ class RecognizerFactory:
             recognizer_type: The type of recognizer to create
             model_path: Path to model file (only used for MEDIAPIPE_TASKS)
             min_score: Minimum confidence threshold
-            mirror_view: Whether to flip the frame horizontally
+            mirror_view: Mirror landmark x when drawing (the hybrid recognizer
+                also swaps the sign of LEFT/RIGHT movement); the input frame
+                is never flipped
+            out_of_process: Run the recognizer in a child process (ignored
+                            in PyInstaller bundles, which fall back to in-process)
             **kwargs: Additional arguments passed to the recognizer constructor
             
         Returns:
@@ -63,25 +96,19 @@ class RecognizerFactory:
         Raises:
             ValueError: If an unknown recognizer type is provided
         """
-        if recognizer_type == RecognizerType.MEDIAPIPE_TASKS:
-            if model_path is None:
-                model_path = asset_path("gesture_recognizer.task")
-            return GestureRecognizerMP(
+        if out_of_process and not getattr(sys, "frozen", False):
+            return ProcessRecognizer(
+                recognizer_type,
                 model_path=model_path,
                 min_score=min_score,
                 mirror_view=mirror_view,
                 **kwargs,
             )
-        
-        elif recognizer_type == RecognizerType.HYBRID_POSE:
-            return HybridGestureRecognizer(
-                min_detection_confidence=min_score,
-                mirror_view=mirror_view,
-                **kwargs,
-            )
-        
-        else:
+
+        factory = _FACTORIES.get(recognizer_type)
+        if factory is None:
             raise ValueError(f"Unknown recognizer type: {recognizer_type}")
+        return factory(model_path, min_score, mirror_view, **kwargs)
     
     @staticmethod
     def get_available_types() -> list[RecognizerType]:
@@ -144,7 +171,9 @@ class RecognizerSingleton:
             recognizer_type: The type of recognizer to create
             model_path: Path to model file (only for MEDIAPIPE_TASKS)
             min_score: Minimum confidence threshold
-            mirror_view: Whether to flip the frame horizontally
+            mirror_view: Mirror landmark x when drawing (the hybrid recognizer
+                also swaps the sign of LEFT/RIGHT movement); the input frame
+                is never flipped
             force_recreate: If True, recreate even if same type exists
             **kwargs: Additional arguments for the recognizer
             
@@ -190,6 +219,11 @@ class RecognizerSingleton:
         Returns:
             The gesture recognizer instance
         """
+        # Fast path without the lock; attribute assignment is atomic
+        instance = cls._instance
+        if instance is not None:
+            return instance
+
         with cls._lock:
             if cls._instance is None:
                 print("[RecognizerSingleton] No instance configured, creating default MEDIAPIPE_TASKS")
@@ -12,6 +12,7 @@ Gestures:
 - OPEN PALM (all fingers up) = IDLE
 """
 
+import dataclasses
 import time
 import cv2
 import mediapipe as mp
@@ -19,6 +20,30 @@ import numpy as np
 from typing import Any, Optional
 
 from .gesture_interface import GestureRecognizerInterface, GestureResult
+from .image_ops import downscale_to_fit, draw_hand_skeleton
+
+
+# Fingertip / PIP joint landmark indices for index, middle, ring, pinky
+_TIPS = np.array([8, 12, 16, 20])
+_PIPS = np.array([6, 10, 14, 18])
+_FINGER_NAMES = ("thumb", "index", "middle", "ring", "pinky")
+# Bit per finger in the extended-finger mask, thumb = bit 0
+_FINGER_BITS = np.array([1, 2, 4, 8, 16])
+# Static poses by extended-finger mask; others fall through to movement
+_POSE_ACTIONS = {
+    0b00000: ("DUCK", 0.9),     # Fist
+    0b00001: ("SPACE", 0.85),   # Thumb only
+    0b00010: ("JUMP", 0.85),    # Index only
+}
+
+# Result for frames without a hand; frozen, so it can be shared freely
+_IDLE = GestureResult(
+    frame=None,
+    action="IDLE",
+    raw_label=None,
+    confidence=0.0,
+    landmarks=None,
+)
 
 
 class HybridGestureRecognizer(GestureRecognizerInterface):
@@ -37,6 +62,7 @@ class HybridGestureRecognizer(GestureRecognizerInterface):
         movement_threshold: float = 0.05,
         mirror_view: bool = True,
         debug: bool = False,
+        proc_size: Optional[tuple[int, int]] = (640, 360),
     ):
         """
         Initialize the pose-based recognizer.
@@ -45,12 +71,17 @@ class HybridGestureRecognizer(GestureRecognizerInterface):
             min_detection_confidence: MediaPipe hand detection confidence
             min_tracking_confidence: MediaPipe hand tracking confidence
             movement_threshold: Minimum movement delta to trigger LEFT/RIGHT
-            mirror_view: Whether to flip the frame horizontally
+            mirror_view: Mirror landmark x when drawing and swap the sign of
+                LEFT/RIGHT movement, to match a flipped display frame; the
+                input frame is never flipped
             debug: Print debug information
+            proc_size: (width, height) box larger frames are downscaled into
+                before inference, keeping aspect ratio (None to disable)
         """
         self.mirror_view = mirror_view
         self.debug = debug
         self.movement_threshold = movement_threshold
+        self.proc_size = proc_size
         
         # Initialize MediaPipe Hands
         self._mp_hands = mp.solutions.hands
@@ -66,6 +97,14 @@ class HybridGestureRecognizer(GestureRecognizerInterface):
         self._prev_index_x: Optional[float] = None
         self._prev_index_y: Optional[float] = None
         self._frames_without_hand = 0
+
+        # Landmark x/y/z snapshot, refilled in place every frame
+        self._lm_scratch = np.empty((21, 3), dtype=np.float32)
+
+        # Reused downscale / RGB conversion buffers, (re)allocated on first
+        # frame / size change
+        self._small: Optional[np.ndarray] = None
+        self._rgb: Optional[np.ndarray] = None
         
         print("[PoseBasedRecognizer] Initialized")
         print("[PoseBasedRecognizer] Gestures:")
@@ -91,15 +130,23 @@ class HybridGestureRecognizer(GestureRecognizerInterface):
             "OPEN PALM": "IDLE",
         }
 
-    def process(self, frame_bgr: np.ndarray) -> GestureResult:
+    def process(self, frame_bgr: np.ndarray, needs_frame: bool = True) -> GestureResult:
         """
         Process a BGR frame and return gesture result.
+
+        The frame is not flipped: landmarks stay in camera coordinates and
+        mirror_view is applied to the movement direction and when drawing.
         """
-        if self.mirror_view:
-            frame_bgr = cv2.flip(frame_bgr, 1)
+        # Landmarks (and every threshold below) are normalized, so running
+        # on a smaller copy changes nothing downstream
+        small = downscale_to_fit(frame_bgr, self.proc_size, self._small)
+        if small is not frame_bgr:
+            self._small = small
 
-        rgb = cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2RGB)
-        results = self._hands.process(rgb)
+        if self._rgb is None or self._rgb.shape != small.shape:
+            self._rgb = np.empty(small.shape, dtype=np.uint8)
+        cv2.cvtColor(small, cv2.COLOR_BGR2RGB, dst=self._rgb)
+        results = self._hands.process(self._rgb)
 
         # No hand detected
         if not results.multi_hand_landmarks:
@@ -111,14 +158,10 @@ class HybridGestureRecognizer(GestureRecognizerInterface):
             # Reset tracking
             self._prev_index_x = None
             self._prev_index_y = None
-            
-            return GestureResult(
-                frame=frame_bgr,
-                action="IDLE",
-                raw_label=None,
-                confidence=0.0,
-                landmarks=None,
-            )
+
+            if not needs_frame:
+                return _IDLE
+            return dataclasses.replace(_IDLE, frame=frame_bgr)
 
         # Hand detected
         if self._frames_without_hand >= 30 and self.debug:
@@ -126,164 +169,114 @@ class HybridGestureRecognizer(GestureRecognizerInterface):
         self._frames_without_hand = 0
 
         hand_landmarks = results.multi_hand_landmarks[0]
-        
+
         # Classify pose
-        gesture, confidence = self._classify_pose(hand_landmarks)
+        gesture, confidence = self._classify_pose(self._snapshot(hand_landmarks))
         
         return GestureResult(
-            frame=frame_bgr,
+            frame=frame_bgr if needs_frame else None,
             action=gesture,
             raw_label=gesture,  # Same as action for pose-based
             confidence=confidence,
-            landmarks=hand_landmarks.landmark,  # Return list of landmarks, not NormalizedLandmarkList
+            # Return list of landmarks, not NormalizedLandmarkList
+            landmarks=hand_landmarks.landmark if needs_frame else None,
         )
 
-    def _is_finger_extended(self, landmarks, tip_id: int, pip_id: int) -> bool:
-        """Check if a finger is extended by comparing tip to PIP joint."""
-        tip = landmarks.landmark[tip_id]
-        pip = landmarks.landmark[pip_id]
-        # Finger extended if tip is above (lower y) PIP with threshold
-        return tip.y < (pip.y - 0.02)
-
-    def _is_thumb_extended(self, landmarks) -> bool:
-        """Special check for thumb using different geometry."""
-        thumb_tip = landmarks.landmark[4]
-        thumb_ip = landmarks.landmark[3]
-        wrist = landmarks.landmark[0]
-        
-        tip_dist = abs(thumb_tip.x - wrist.x)
-        ip_dist = abs(thumb_ip.x - wrist.x)
-        
-        return tip_dist > (ip_dist + 0.03)
-
-    def _count_extended_fingers(self, landmarks) -> tuple[dict, int]:
-        """Count how many fingers are extended."""
-        fingers = {
-            'thumb': self._is_thumb_extended(landmarks),
-            'index': self._is_finger_extended(landmarks, 8, 6),
-            'middle': self._is_finger_extended(landmarks, 12, 10),
-            'ring': self._is_finger_extended(landmarks, 16, 14),
-            'pinky': self._is_finger_extended(landmarks, 20, 18),
-        }
-        
+    def _snapshot(self, landmarks) -> np.ndarray:
+        """
+        Copy landmark x/y/z into the preallocated (21, 3) buffer.
+
+        Crosses the protobuf boundary once per landmark; everything after
+        this works on the array.
+        """
+        out = self._lm_scratch
+        for i, p in enumerate(landmarks.landmark):
+            out[i] = (p.x, p.y, p.z)
+        return out
+
+    def _extended_finger_mask(self, lm: np.ndarray) -> int:
+        """
+        Check which fingers are extended.
+
+        Returns a bitmask with bit i set if finger i of
+        [thumb, index, middle, ring, pinky] is extended.
+        """
+        fingers = np.empty(5, dtype=bool)
+        # Thumb: tip further from the wrist horizontally than the IP joint
+        fingers[0] = abs(lm[4, 0] - lm[0, 0]) > abs(lm[3, 0] - lm[0, 0]) + 0.03
+        # Other fingers: tip above (lower y) the PIP joint with threshold
+        fingers[1:] = lm[_TIPS, 1] < (lm[_PIPS, 1] - 0.02)
+
         if self.debug:
-            extended = [name for name, ext in fingers.items() if ext]
+            extended = [name for name, ext in zip(_FINGER_NAMES, fingers) if ext]
             print(f"    [DEBUG] Extended fingers: {extended}")
-        
-        return fingers, sum(fingers.values())
 
-    def _detect_index_movement(self, landmarks) -> str:
+        return int(fingers @ _FINGER_BITS)
+
+    def _detect_index_movement(self, lm: np.ndarray) -> str:
         """Detect LEFT/RIGHT movement based on index finger tip movement."""
-        index_tip = landmarks.landmark[8]
-        
+        index_x = float(lm[8, 0])
+        index_y = float(lm[8, 1])
+
         # Initialize on first frame
         if self._prev_index_x is None or self._prev_index_y is None:
-            self._prev_index_x = index_tip.x
-            self._prev_index_y = index_tip.y
+            self._prev_index_x = index_x
+            self._prev_index_y = index_y
             return "NEUTRAL"
-        
+
         # Calculate movement delta
-        delta_x = index_tip.x - self._prev_index_x
-        delta_y = index_tip.y - self._prev_index_y
-        
+        delta_x = index_x - self._prev_index_x
+        delta_y = index_y - self._prev_index_y
+
         # Update previous position
-        self._prev_index_x = index_tip.x
-        self._prev_index_y = index_tip.y
+        self._prev_index_x = index_x
+        self._prev_index_y = index_y
+
+        # Landmarks are in camera coordinates; flip the sign so LEFT/RIGHT
+        # match what the user sees in the mirrored view
+        if self.mirror_view:
+            delta_x = -delta_x
         
         if self.debug:
             print(f"    [DEBUG] Index delta_x: {delta_x:.3f}, delta_y: {delta_y:.3f}")
         
-        # Check if movement is significant
-        if abs(delta_x) > self.movement_threshold or abs(delta_y) > self.movement_threshold:
-            if abs(delta_x) > abs(delta_y):
-                # Account for mirroring - swapped for correct user perspective
-                if delta_x < -self.movement_threshold:
-                    return "LEFT"
-                elif delta_x > self.movement_threshold:
-                    return "RIGHT"
-        
-        return "NEUTRAL"
+        # Horizontal movement must dominate and clear the threshold; its
+        # sign then picks the direction
+        adx = abs(delta_x)
+        if adx <= abs(delta_y) or adx <= self.movement_threshold:
+            return "NEUTRAL"
+        return "LEFT" if delta_x < 0 else "RIGHT"
 
-    def _classify_pose(self, landmarks) -> tuple[str, float]:
+    def _classify_pose(self, lm: np.ndarray) -> tuple[str, float]:
         """Classify the hand pose into a gesture with confidence."""
-        fingers, count = self._count_extended_fingers(landmarks)
-        index_movement = self._detect_index_movement(landmarks)
-        
+        mask = self._extended_finger_mask(lm)
+        # Always run: it also tracks the previous index position
+        index_movement = self._detect_index_movement(lm)
+
         if self.debug:
-            print(f"    [DEBUG] Finger count: {count}, Movement: {index_movement}")
-        
-        # Priority 1: FIST = DUCK
-        if count == 0:
-            if self.debug:
-                print("    [DEBUG] → FIST detected = DUCK")
-            return "DUCK", 0.9
-        
-        # Priority 2: THUMB ONLY = SPACE
-        if count == 1 and fingers['thumb']:
+            print(f"    [DEBUG] Finger mask: {mask:05b}, Movement: {index_movement}")
+
+        # Static poses first: FIST = DUCK, THUMB ONLY = SPACE, INDEX ONLY = JUMP
+        pose = _POSE_ACTIONS.get(mask)
+        if pose is not None:
             if self.debug:
-                print("    [DEBUG] → THUMB UP = SPACE")
-            return "SPACE", 0.85
-        
-        # Priority 3: INDEX ONLY = JUMP
-        if count == 1 and fingers['index']:
+                print(f"    [DEBUG] → {pose[0]}")
+            return pose
+
+        # INDEX MOVEMENT (2+ fingers)
+        if index_movement != "NEUTRAL" and mask.bit_count() >= 2:
             if self.debug:
-                print("    [DEBUG] → INDEX FINGER UP = JUMP")
-            return "JUMP", 0.85
-        
-        # Priority 4: INDEX MOVEMENT (2+ fingers)
-        if count >= 2:
-            if index_movement == "LEFT":
-                if self.debug:
-                    print("    [DEBUG] → Moving LEFT")
-                return "LEFT", 0.8
-            elif index_movement == "RIGHT":
-                if self.debug:
-                    print("    [DEBUG] → Moving RIGHT")
-                return "RIGHT", 0.8
-        
+                print(f"    [DEBUG] → Moving {index_movement}")
+            return index_movement, 0.8
+
         # Default: IDLE
         return "IDLE", 0.5
 
     def draw_landmarks(self, frame: np.ndarray, landmarks: Any) -> np.ndarray:
-        """Draw hand skeleton on frame."""
+        """Draw hand skeleton on the display frame (mirrored if mirror_view)."""
         if landmarks is None:
             return frame
-            
-        h, w, _ = frame.shape
-        
-        connections = [
-            # Thumb
-            (0, 1), (1, 2), (2, 3), (3, 4),
-            # Index
-            (0, 5), (5, 6), (6, 7), (7, 8),
-            # Middle
-            (0, 9), (9, 10), (10, 11), (11, 12),
-            # Ring
-            (0, 13), (13, 14), (14, 15), (15, 16),
-            # Pinky
-            (0, 17), (17, 18), (18, 19), (19, 20),
-            # Palm
-            (5, 9), (9, 13), (13, 17),
-        ]
-        
-        # Extract points (flip x for mirror view)
-        points = []
-        for lm in landmarks.landmark:
-            x = int(w - (lm.x * w))  # Mirror x-coordinate
-            y = int(lm.y * h)
-            points.append((x, y))
-        
-        # Draw connections
-        for start_idx, end_idx in connections:
-            cv2.line(frame, points[start_idx], points[end_idx], (0, 255, 0), 2)
-        
-        # Draw landmarks
-        for i, point in enumerate(points):
-            color = (0, 255, 255) if i == 8 else (255, 0, 255)
-            radius = 8 if i == 8 else 4
-            cv2.circle(frame, point, radius, color, -1)
-        
-        return frame
+        return draw_hand_skeleton(frame, landmarks, self.mirror_view)
 
     def cleanup(self) -> None:
         """Release MediaPipe resources."""
@@ -14,9 +14,13 @@ import numpy as np
 from typing import Any, Optional
 
 from .gesture_interface import GestureRecognizerInterface, GestureResult
+from .image_ops import downscale_to_fit, draw_hand_skeleton
 from .paths import asset_path
 
 
+_BGR2RGB = cv2.COLOR_BGR2RGB
+_SRGB = mp.ImageFormat.SRGB
+
 # MediaPipe label -> game action
 LABEL_TO_ACTION = {
     "Victory": "LEFT",
@@ -41,6 +45,7 @@ class GestureRecognizerMP(GestureRecognizerInterface):
         min_score: float = 0.60,
         max_hands: int = 1,
         mirror_view: bool = True,
+        proc_size: Optional[tuple[int, int]] = (640, 360),
     ):
         """
         Initialize the MediaPipe Tasks recognizer.
@@ -49,23 +54,38 @@ class GestureRecognizerMP(GestureRecognizerInterface):
             model_path: Path to gesture_recognizer.task file (uses default if None)
             min_score: Minimum confidence threshold (0.0 - 1.0)
             max_hands: Maximum number of hands to detect
-            mirror_view: Whether to flip the frame horizontally
+            mirror_view: Mirror landmark x when drawing, to match a flipped
+                display frame; the input frame is never flipped
+            proc_size: (width, height) box larger frames are downscaled into
+                before inference, keeping aspect ratio (None to disable)
         """
         if model_path is None:
             model_path = asset_path("gesture_recognizer.task")
             
         self.min_score = min_score
         self.mirror_view = mirror_view
+        self.proc_size = proc_size
+        # Bound once: looked up on every frame
+        self._action_for_label = LABEL_TO_ACTION.get
+        if max_hands == 1:
+            # Only one hand can be reported, no need to compare across hands
+            self._get_top_label = self._get_top_label_single_hand
         self._last_result = None
         self._last_timestamp_ms = 0
+        # Inference input buffers, (re)allocated on the first frame of a new size
+        self._small: Optional[np.ndarray] = None
+        self._rgb: Optional[np.ndarray] = None
+        # Landmarks of the last result as normalized (x, y, z) rows
+        self._lm_buf = np.empty((21, 3), dtype=np.float32)
 
         base_options = python.BaseOptions(model_asset_path=model_path)
 
         options = vision.GestureRecognizerOptions(
             base_options=base_options,
-            running_mode=vision.RunningMode.LIVE_STREAM,
+            # VIDEO mode returns the result for the frame just submitted;
+            # LIVE_STREAM's callback usually delivers the previous frame's
+            running_mode=vision.RunningMode.VIDEO,
             num_hands=max_hands,
-            result_callback=self._on_result,
         )
 
         self._recognizer = vision.GestureRecognizer.create_from_options(options)
@@ -80,82 +100,101 @@ class GestureRecognizerMP(GestureRecognizerInterface):
     @property
     def keyMap(self) -> dict[str,str]:
         return LABEL_TO_ACTION
-    def _on_result(
-        self,
-        result: vision.GestureRecognizerResult,
-        output_image: mp.Image,
-        timestamp_ms: int
-    ):
-        """Callback for async gesture recognition."""
-        self._last_result = result
-        self._last_timestamp_ms = timestamp_ms
 
-    def process(self, frame_bgr: np.ndarray) -> GestureResult:
+    def process(self, frame_bgr: np.ndarray, needs_frame: bool = True) -> GestureResult:
         """
         Process a BGR frame and return gesture result.
+
+        The frame is not flipped: none of the canned gestures depend on
+        handedness, so landmarks stay in camera coordinates and mirror_view
+        is only applied when drawing.
+
+        With needs_frame=False (headless callers that never draw), the
+        result carries no frame and no landmarks.
         """
-        if self.mirror_view:
-            frame_bgr = cv2.flip(frame_bgr, 1)
+        # The model runs at ~256px anyway; shrinking first means the RGB
+        # conversion below touches far fewer pixels. Landmarks are
+        # normalized, so they still map onto the full-size frame.
+        frame_small = self._downscale(frame_bgr)
+
+        if self._rgb is None or self._rgb.shape != frame_small.shape:
+            self._rgb = np.empty_like(frame_small)
 
         # Convert to RGB for MediaPipe
-        rgb = cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2RGB)
-        mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb)
+        cv2.cvtColor(frame_small, _BGR2RGB, dst=self._rgb)
+        # mp.Image copies the pixels, so the buffer can be reused next frame
+        mp_image = mp.Image(image_format=_SRGB, data=self._rgb)
 
-        # Generate unique timestamp
-        timestamp_ms = int(time.time() * 1000)
+        # Generate unique timestamp (monotonic: wall-clock jumps would make
+        # MediaPipe reject or reorder frames)
+        timestamp_ms = time.monotonic_ns() // 1_000_000
         if timestamp_ms <= self._last_timestamp_ms:
             timestamp_ms = self._last_timestamp_ms + 1
         self._last_timestamp_ms = timestamp_ms
 
-        # Run async recognition
-        self._recognizer.recognize_async(mp_image, timestamp_ms)
+        # Run recognition (synchronous, so landmarks match this frame)
+        self._last_result = self._recognizer.recognize_for_video(mp_image, timestamp_ms)
 
         # Get results
         label, score = self._get_top_label()
-        action = self._label_to_action(label, score)
-        landmarks = self._get_hand_landmarks()
+        if not label or score < self.min_score:
+            action = "IDLE"
+        else:
+            action = self._action_for_label(label, "IDLE")
+        landmarks = self._get_hand_landmarks() if needs_frame else None
 
         return GestureResult(
-            frame=frame_bgr,
+            frame=frame_bgr if needs_frame else None,
             action=action,
             raw_label=label,
             confidence=score,
             landmarks=landmarks,
         )
 
+    def _downscale(self, frame_bgr: np.ndarray) -> np.ndarray:
+        """Shrink the frame to fit proc_size; smaller frames pass through."""
+        small = downscale_to_fit(frame_bgr, self.proc_size, self._small)
+        if small is not frame_bgr:
+            self._small = small
+        return small
+
     def _get_top_label(self) -> tuple[Optional[str], float]:
         """Get the highest confidence gesture label."""
-        if self._last_result is None or not self._last_result.gestures:
+        result = self._last_result
+        if result is None or not (gestures := result.gestures):
             return None, 0.0
 
-        best_label = None
+        # Compare scores first; only the winner's label is read
+        best = None
         best_score = 0.0
+        for hand_gestures in gestures:
+            if hand_gestures and (score := hand_gestures[0].score) > best_score:
+                best_score = score
+                best = hand_gestures[0]
 
-        for hand_gestures in self._last_result.gestures:
-            if not hand_gestures:
-                continue
-            top = hand_gestures[0]
-            if float(top.score) > best_score:
-                best_score = float(top.score)
-                best_label = top.category_name
+        return (best.category_name if best is not None else None), best_score
 
-        return best_label, best_score
-
-    def _label_to_action(self, label: Optional[str], score: float) -> str:
-        """Convert MediaPipe label to game action."""
-        if not label or score < self.min_score:
-            return "IDLE"
-        return LABEL_TO_ACTION.get(label, "IDLE")
+    def _get_top_label_single_hand(self) -> tuple[Optional[str], float]:
+        """_get_top_label for max_hands=1: index the only hand directly."""
+        result = self._last_result
+        if result is None or not (gestures := result.gestures) or not gestures[0]:
+            return None, 0.0
+        top = gestures[0][0]
+        return top.category_name, top.score
 
-    def _get_hand_landmarks(self) -> Optional[Any]:
-        """Get hand landmarks from last result."""
-        if self._last_result is None:
-            return None
-        if not hasattr(self._last_result, "hand_landmarks"):
-            return None
-        if not self._last_result.hand_landmarks:
+    def _get_hand_landmarks(self) -> Optional[np.ndarray]:
+        """
+        Get hand landmarks from last result (first hand only) as a (21, 3)
+        float32 array. The array is reused: it is only valid until the
+        next process() call.
+        """
+        result = self._last_result
+        if result is None or not result.hand_landmarks:
             return None
-        return self._last_result.hand_landmarks[0]
+        out = self._lm_buf
+        for i, lm in enumerate(result.hand_landmarks[0]):
+            out[i] = (lm.x, lm.y, lm.z)
+        return out
 
     def draw_landmarks(self, frame: np.ndarray, landmarks: Any) -> np.ndarray:
         """
@@ -163,44 +202,7 @@ class GestureRecognizerMP(GestureRecognizerInterface):
         """
         if landmarks is None:
             return frame
-            
-        h, w, _ = frame.shape
-        
-        # MediaPipe hand connections
-        connections = [
-            # Thumb
-            (0, 1), (1, 2), (2, 3), (3, 4),
-            # Index
-            (0, 5), (5, 6), (6, 7), (7, 8),
-            # Middle
-            (0, 9), (9, 10), (10, 11), (11, 12),
-            # Ring
-            (0, 13), (13, 14), (14, 15), (15, 16),
-            # Pinky
-            (0, 17), (17, 18), (18, 19), (19, 20),
-            # Palm
-            (5, 9), (9, 13), (13, 17),
-        ]
-        
-        # Convert landmarks to pixel coordinates
-        points = []
-        for lm in landmarks:
-            x = int(lm.x * w)
-            y = int(lm.y * h)
-            points.append((x, y))
-        
-        # Draw connections
-        for start_idx, end_idx in connections:
-            if start_idx < len(points) and end_idx < len(points):
-                cv2.line(frame, points[start_idx], points[end_idx], (0, 255, 0), 2)
-        
-        # Draw landmarks
-        for i, point in enumerate(points):
-            color = (0, 255, 255) if i == 8 else (255, 0, 255)  # Highlight index tip
-            radius = 8 if i == 8 else 4
-            cv2.circle(frame, point, radius, color, -1)
-        
-        return frame
+        return draw_hand_skeleton(frame, landmarks, self.mirror_view)
 
     def cleanup(self) -> None:
         """Release MediaPipe resources."""
@@ -0,0 +1,291 @@
+"""
+Out-of-process Gesture Recognizer.
+
+Runs any recognizer from the factory inside a spawned child process, so
+MediaPipe inference and the Python-side classification don't compete for
+the GIL with the Qt UI. Frames go to the child through a shared-memory
+buffer; only the small result (action, label, score, landmarks) comes back.
+
+Created through RecognizerFactory.create(..., out_of_process=True), or
+RecognizerSingleton.configure(..., out_of_process=True).
+"""
+
+import multiprocessing
+from multiprocessing import shared_memory
+import queue
+import threading
+import time
+from typing import Any, Optional
+
+import numpy as np
+
+from .gesture_interface import GestureRecognizerInterface, GestureResult
+from .image_ops import draw_hand_skeleton
+
+
+def _inference_main(recognizer_type, factory_kwargs, in_q, out_q):
+    """
+    Child process entry point.
+
+    Messages on in_q:
+        ("shm", name, shape): attach to a new shared frame buffer
+        seq (int):            process the frame currently in the buffer
+        None:                 shut down
+
+    The first message on out_q is ("ready", name, key_map), or
+    ("error", description) if the recognizer could not be created.
+    """
+    try:
+        # Imported here: the factory imports this module
+        from .recognizer_factory import RecognizerFactory
+
+        recognizer = RecognizerFactory.create(recognizer_type, **factory_kwargs)
+    except Exception as e:
+        out_q.put(("error", repr(e)))
+        return
+    out_q.put(("ready", recognizer.name, dict(recognizer.keyMap)))
+
+    shm = None
+    frame = None
+    try:
+        while True:
+            msg = in_q.get()
+            if msg is None:
+                break
+
+            if isinstance(msg, tuple):
+                _, name, shape = msg
+                if shm is not None:
+                    frame = None
+                    shm.close()
+                shm = shared_memory.SharedMemory(name=name)
+                frame = np.ndarray(shape, dtype=np.uint8, buffer=shm.buf)
+                continue
+
+            result = recognizer.process(frame)
+            # Ship landmarks as a (21, 3) array: picklable and compact
+            landmarks = result.landmarks
+            if isinstance(landmarks, np.ndarray):
+                landmarks = landmarks.copy()
+            elif landmarks is not None:
+                landmarks = np.array(
+                    [(lm.x, lm.y, lm.z) for lm in landmarks], dtype=np.float32
+                )
+            out_q.put((
+                msg,
+                result.action,
+                result.raw_label,
+                result.confidence,
+                landmarks,
+            ))
+    finally:
+        recognizer.cleanup()
+        frame = None
+        if shm is not None:
+            shm.close()
+
+
+class ProcessRecognizer(GestureRecognizerInterface):
+    """
+    Proxy that runs a recognizer in a child process.
+
+    The child is started with the "spawn" method so MediaPipe initializes
+    cleanly. Each process() call copies the frame into shared memory and
+    blocks until the child returns the result; concurrent calls are
+    serialized, since they share the buffer and the result queue.
+
+    Usage:
+        recognizer = ProcessRecognizer(RecognizerType.HYBRID_POSE, mirror_view=True)
+    """
+
+    def __init__(
+        self,
+        recognizer_type,
+        mirror_view: bool = True,
+        result_timeout_s: float = 1.0,
+        startup_timeout_s: float = 30.0,
+        **factory_kwargs,
+    ):
+        """
+        Start the child process and wait for its recognizer to load.
+
+        Args:
+            recognizer_type: RecognizerType to create inside the child
+            mirror_view: Mirror landmark x when drawing (the hybrid recognizer
+                also swaps the sign of LEFT/RIGHT movement); the input frame
+                is never flipped
+            result_timeout_s: Max time to wait for a result before returning IDLE
+            startup_timeout_s: Max time to wait for the child's recognizer to load
+            **factory_kwargs: Passed to RecognizerFactory.create in the child
+
+        Raises:
+            RuntimeError: If the child fails to create the recognizer, exits,
+                          or doesn't finish loading within startup_timeout_s
+        """
+        self.mirror_view = mirror_view
+        self._timeout = result_timeout_s
+        self._seq = 0
+        # True while the child may still be reading the shared buffer for
+        # a request whose result we stopped waiting for
+        self._in_flight = False
+        self._lock = threading.Lock()
+
+        self._shm: Optional[shared_memory.SharedMemory] = None
+        self._shm_frame: Optional[np.ndarray] = None
+
+        ctx = multiprocessing.get_context("spawn")
+        self._in_q = ctx.Queue()
+        self._out_q = ctx.Queue()
+        self._proc = ctx.Process(
+            target=_inference_main,
+            args=(
+                recognizer_type,
+                dict(factory_kwargs, mirror_view=mirror_view),
+                self._in_q,
+                self._out_q,
+            ),
+            daemon=True,
+        )
+        self._proc.start()
+
+        try:
+            self._name, self._key_map = self._wait_ready(startup_timeout_s)
+        except RuntimeError:
+            self.cleanup()
+            raise
+        print(f"[ProcessRecognizer] Running {self._name} in pid {self._proc.pid}")
+
+    def _wait_ready(self, timeout: float) -> tuple[str, dict[str, str]]:
+        """Wait for the child's startup message; raise if it never comes."""
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                msg = self._out_q.get(timeout=0.25)
+            except queue.Empty:
+                if not self._proc.is_alive():
+                    raise RuntimeError(
+                        f"Recognizer process exited during startup "
+                        f"(exit code {self._proc.exitcode})"
+                    )
+                if time.monotonic() >= deadline:
+                    raise RuntimeError(f"Recognizer process did not start within {timeout:.0f}s")
+                continue
+
+            if msg[0] == "error":
+                raise RuntimeError(f"Recognizer process failed to start: {msg[1]}")
+            _, name, key_map = msg
+            return name, key_map
+
+    @property
+    def name(self) -> str:
+        return f"{self._name} (subprocess)"
+
+    @property
+    def keyMap(self) -> dict[str, str]:
+        return self._key_map
+
+    def _alloc_shared(self, shape: tuple) -> None:
+        """(Re)create the shared frame buffer and hand it to the child."""
+        self._release_shared()
+        self._shm = shared_memory.SharedMemory(create=True, size=int(np.prod(shape)))
+        self._shm_frame = np.ndarray(shape, dtype=np.uint8, buffer=self._shm.buf)
+        self._in_q.put(("shm", self._shm.name, shape))
+
+    def _release_shared(self) -> None:
+        if self._shm is not None:
+            self._shm_frame = None
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
+    def process(self, frame_bgr: np.ndarray, needs_frame: bool = True) -> GestureResult:
+        """
+        Process a BGR frame in the child process and return gesture result.
+
+        Raises:
+            RuntimeError: If the child process has died
+        """
+        with self._lock:
+            return self._process(frame_bgr, needs_frame)
+
+    def _wait_reply(self) -> Optional[tuple]:
+        """
+        Wait for the child's answer to the in-flight request.
+
+        Only one request is ever outstanding, so the next reply is its
+        answer. Returns None on timeout; the request then stays in flight.
+
+        Raises:
+            RuntimeError: If the child process has died
+        """
+        try:
+            reply = self._out_q.get(timeout=self._timeout)
+        except queue.Empty:
+            self._check_alive()
+            return None
+        self._in_flight = False
+        return reply
+
+    def _check_alive(self) -> None:
+        if not self._proc.is_alive():
+            raise RuntimeError(
+                f"Recognizer process {self._proc.pid} died "
+                f"(exit code {self._proc.exitcode})"
+            )
+
+    def _process(self, frame_bgr: np.ndarray, needs_frame: bool) -> GestureResult:
+        # A dead child would otherwise cost result_timeout_s per frame
+        self._check_alive()
+
+        # A timed-out request may still be reading the shared buffer;
+        # writing the next frame now could hand the child a torn image
+        if self._in_flight and self._wait_reply() is None:
+            return GestureResult(
+                frame=frame_bgr if needs_frame else None,
+                action="IDLE",
+                raw_label=None,
+                confidence=0.0,
+                landmarks=None,
+            )
+
+        if self._shm_frame is None or self._shm_frame.shape != frame_bgr.shape:
+            self._alloc_shared(frame_bgr.shape)
+
+        np.copyto(self._shm_frame, frame_bgr)
+        self._seq += 1
+        self._in_q.put(self._seq)
+        self._in_flight = True
+
+        reply = self._wait_reply()
+        if reply is None:
+            return GestureResult(
+                frame=frame_bgr if needs_frame else None,
+                action="IDLE",
+                raw_label=None,
+                confidence=0.0,
+                landmarks=None,
+            )
+        _, action, raw_label, confidence, landmarks = reply
+
+        return GestureResult(
+            frame=frame_bgr if needs_frame else None,
+            action=action,
+            raw_label=raw_label,
+            confidence=confidence,
+            landmarks=landmarks if needs_frame else None,
+        )
+
+    def draw_landmarks(self, frame: np.ndarray, landmarks: Any) -> np.ndarray:
+        """Draw hand skeleton on the display frame (mirrored if mirror_view)."""
+        if landmarks is None:
+            return frame
+        return draw_hand_skeleton(frame, landmarks, self.mirror_view)
+
+    def cleanup(self) -> None:
+        """Stop the child process and free the shared frame buffer."""
+        if self._proc.is_alive():
+            self._in_q.put(None)
+            self._proc.join(timeout=2.0)
+            if self._proc.is_alive():
+                self._proc.terminate()
+        self._release_shared()
@@ -1,7 +1,9 @@
+import collections
+import threading
 import time
-import cv2
 
 from PySide6.QtCore import QThread, Signal
+from .camera_broker import FrameBroker
 from .recognizer_factory import RecognizerFactory, RecognizerType
 
 
@@ -17,47 +19,88 @@ class UIGestureWorker(QThread):
         super().__init__(parent)
         self.running = True
 
-        # Create a DEDICATED recognizer for UI navigation only
-        # This is separate from the singleton used for games
-        self.recognizer = RecognizerFactory.create(RecognizerType.MEDIAPIPE_TASKS)
+        # DEDICATED recognizer for UI navigation only, separate from the
+        # singleton used for games. Created in run(): loading the model (or
+        # starting its child process) must not block the GUI thread
+        self.recognizer = None
 
         self.last_action = "IDLE"
         self.cooldown_s = 0.55
         self.last_emit_time = 0.0
 
+        # A gesture must be seen on this many consecutive inferences before
+        # it is emitted, so single-frame misclassifications don't navigate
+        self.confirm_frames = 3
+        self._confirm = collections.deque(maxlen=self.confirm_frames)
+
+        # Menu navigation only fires every cooldown_s, so run inference at a
+        # low rate while idle and speed up once a gesture is in progress
+        self.infer_interval = 1 / 10.0
+        self.active_infer_interval = 1 / 30.0
+        self.last_infer_time = 0.0
+
+        # Set by stop(); the throttle waits on it so shutdown is immediate
+        self._stop_event = threading.Event()
+
     def stop(self):
         self.running = False
+        self._stop_event.set()
 
     def run(self):
-        cap = cv2.VideoCapture(0)
-        cap.set(cv2.CAP_PROP_FRAME_WIDTH, 1280)
-        cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 720)
+        try:
+            self.recognizer = RecognizerFactory.create(RecognizerType.MEDIAPIPE_TASKS)
+        except Exception as e:
+            print(f"❌ UIGestureWorker: Could not create recognizer: {e}")
+            return
 
-        if not cap.isOpened():
+        # The camera is shared with the game worker through the broker,
+        # whose grab thread always holds the newest frame
+        broker = FrameBroker.get_instance()
+        if not broker.acquire():
+            self.recognizer.cleanup()
             return
 
+        seq = 0
+
         try:
             while self.running:
-                ret, frame = cap.read()
-                if not ret:
-                    time.sleep(0.01)
+                idle = self.last_action == "IDLE" and not self._confirm
+                interval = self.infer_interval if idle else self.active_infer_interval
+                wait = self.last_infer_time + interval - time.monotonic()
+                if wait > 0:
+                    # The grabber keeps draining meanwhile, so the frame
+                    # read after the wait is still the freshest one
+                    if self._stop_event.wait(wait):
+                        break
+
+                seq, frame = broker.wait_frame(seq)
+                if frame is None:
                     continue
 
-                result = self.recognizer.process(frame)
+                self.last_infer_time = time.monotonic()
+                # Nothing is drawn here, so skip frame/landmark passthrough
+                result = self.recognizer.process(frame, needs_frame=False)
                 action = result.action
 
-                # Emit only on IDLE -> ACTION (edge trigger)
-                now = time.time()
-                if action != "IDLE" and self.last_action == "IDLE":
-                    if (now - self.last_emit_time) >= self.cooldown_s:
-                        self.action_signal.emit(action)
-                        self.last_emit_time = now
-
-                self.last_action = action
-                time.sleep(0.005)
+                # Emit only on IDLE -> ACTION (edge trigger), once the
+                # action has been confirmed over the whole window
+                now = time.monotonic()
+                confirm = self._confirm
+                if action == "IDLE":
+                    confirm.clear()
+                    self.last_action = "IDLE"
+                elif self.last_action == "IDLE":
+                    confirm.append(action)
+                    if len(confirm) == confirm.maxlen and confirm.count(action) == confirm.maxlen:
+                        confirm.clear()
+                        # Latched until the hand returns to IDLE
+                        self.last_action = action
+                        if (now - self.last_emit_time) >= self.cooldown_s:
+                            self.action_signal.emit(action)
+                            self.last_emit_time = now
 
         finally:
-            cap.release()
+            broker.release()
             # Clean up the dedicated recognizer
             if self.recognizer:
                 self.recognizer.cleanup()
\ No newline at end of file
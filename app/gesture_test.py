@@ -2,6 +2,7 @@ import sys
 import time
 import cv2
 
+from .core.camera_broker import FrameBroker
 from .core.recognizer_factory import get_recognizer, RecognizerSingleton, RecognizerType
 from .core.controller import GameController
 from .core.performance import PerformanceTracker
@@ -32,26 +33,50 @@ def main():
     enabled = True
     profile = "Subway Surfers"  # you can change or load from launcher
 
+    # This script is its own process, so it gets its own broker rather than
+    # the launcher's shared one. Its grab thread overlaps camera I/O with
+    # inference; the loop below always gets the newest frame
+    broker = FrameBroker(width=640, height=480)
+    if not broker.acquire():
+        print("❌ Camera could not open")
+        return
+    seq = 0
+
     controller = GameController()
     perf = PerformanceTracker()
 
-    cap = cv2.VideoCapture(0)
-    cap.set(cv2.CAP_PROP_FRAME_WIDTH, 1280)
-    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 720)
+    last_action = "IDLE"
 
-    if not cap.isOpened():
-        print("❌ Camera could not open")
-        return
+    # The camera runs at 640x480; let HighGUI scale the window up when
+    # showing it instead of capturing more pixels than inference needs
+    cv2.namedWindow("Gesture Controller", cv2.WINDOW_NORMAL)
+    cv2.resizeWindow("Gesture Controller", 960, 720)
 
-    last_action = "IDLE"
+    # Preview is capped independently of inference so HighGUI doesn't
+    # steal CPU from the recognizer when it runs faster than 30 FPS
+    render_interval = 1 / 30.0
+    last_render = 0.0
+
+    # wait_frame() times out after 0.1 s; give up once the camera has
+    # delivered nothing for ~5 s (stalled or unplugged)
+    max_empty_reads = 50
+    empty_reads = 0
 
     try:
         while True:
-            start = time.time()
-
-            ret, frame = cap.read()
-            if not ret:
-                break
+            seq, frame = broker.wait_frame(seq)
+            if frame is None:
+                empty_reads += 1
+                if empty_reads >= max_empty_reads:
+                    print("❌ Camera stopped delivering frames")
+                    break
+                # Keep the window and [Q] responsive while waiting
+                if cv2.waitKey(1) & 0xFF == ord("q"):
+                    break
+                continue
+            empty_reads = 0
+
+            start = time.monotonic()
 
             result = recognizer.process(frame)
             frame = result.frame
@@ -61,21 +86,33 @@ def main():
             landmarks = result.landmarks
             latency = perf.latency_ms(start)
 
-            # Draw skeleton
-            if landmarks:
-                frame = draw_hand_skeleton(frame, landmarks)
-
             # ✅ Press only once when gesture starts
             if enabled and action != "IDLE" and last_action == "IDLE":
                 controller.execute_action(action, profile)
 
             last_action = action
 
-            # ✅ Minimal UI only (no profiles, no control text, no space toggle help)
-            frame = draw_ui(frame, action, raw_label, score, perf.get_fps(), latency, enabled)
+            now = time.monotonic()
+            if now - last_render >= render_interval:
+                last_render = now
+
+                # Recognizers return the frame as captured; mirror it for
+                # display. Broker frames are read-only, so draw on a copy
+                if recognizer.mirror_view:
+                    frame = cv2.flip(frame, 1)
+                else:
+                    frame = frame.copy()
+
+                # Draw skeleton
+                if landmarks is not None:
+                    frame = draw_hand_skeleton(frame, landmarks, mirror=recognizer.mirror_view)
+
+                # ✅ Minimal UI only (no profiles, no control text, no space toggle help)
+                frame = draw_ui(frame, action, raw_label, score, perf.get_fps(), latency, enabled)
 
-            cv2.imshow("Gesture Controller", frame)
+                cv2.imshow("Gesture Controller", frame)
 
+            # Always pump HighGUI events so the window and [Q] stay responsive
             key = cv2.waitKey(1) & 0xFF
 
             if key == ord("q"):
@@ -83,7 +120,8 @@ def main():
 
             perf.record_frame()
     finally:
-        cap.release()
+        broker.release()
+        controller.close()
         cv2.destroyAllWindows()
 
 
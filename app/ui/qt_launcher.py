@@ -1,7 +1,8 @@
+import ctypes
 import sys
-import webbrowser
 
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import Qt, QProcess, QTimer, QUrl
+from PySide6.QtGui import QDesktopServices
 from PySide6.QtWidgets import (
     QApplication,
     QMainWindow,
@@ -26,6 +27,51 @@ from app.core.recognizer_factory import (
 SUBWAY_URL = "https://poki.com/en/g/subway-surfers"
 TEMPLE_URL = "https://poki.com/en/g/temple-run-2"
 
+# "Game running" dialog body around the profile name; QLabel renders it
+# as rich text
+_GAME_INFO_HTML_PREFIX = """
+    Selected: <b>"""
+_GAME_INFO_HTML_SUFFIX = """</b><br><br>
+    Gesture control is now running in the background.<br>
+    Make sure the browser tab is focused.<br><br>
+    You can return to the menu anytime.
+"""
+
+
+# Help page: emoji per recognizer gesture label, and the page body
+# (%s: recognizer name, gesture lines)
+_GESTURE_EMOJIS = {
+    "Victory": "✌️",
+    "ILoveYou": "🤟",
+    "Pointing_Up": "☝️",
+    "Closed_Fist": "✊",
+    "Thumb_Up": "👍",
+    "Thumb_Down": "👎",
+    "Open_Palm": "🖐️",
+    "FIST": "✊",
+    "ONE FINGER": "☝️",
+    "THUMB UP": "👍",
+    "INDEX LEFT": "👈",
+    "INDEX RIGHT": "👉",
+    "OPEN PALM": "🖐️",
+}
+_HELP_HTML = """
+    <b>Launcher controls</b><br>
+
+    👊 Closed Fist → Move through buttons<br>
+    👍 Thumb Up → Select / Click<br><br>
+
+    <b>Game gestures</b> (%s)<br>
+
+    %s<br>
+
+    <b>Tips</b><br>
+
+    Keep the browser window focused<br>
+    Better lighting = better detection<br>
+    Stay close enough so your hand is visible
+"""
+
 
 class GameRunningDialog(QDialog):
     def __init__(self, profile: str, parent=None):
@@ -43,14 +89,10 @@ class GameRunningDialog(QDialog):
         title.setAlignment(Qt.AlignCenter)
 
         # ✅ Use HTML + <br> (since QLabel becomes RichText)
-        info = QLabel(
-            f"""
-            Selected: <b>{profile}</b><br><br>
-            Gesture control is now running in the background.<br>
-            Make sure the browser tab is focused.<br><br>
-            You can return to the menu anytime.
-            """
-        )
+        info = QLabel()
+        self._info_label = info
+        self._profile = None
+        self.set_profile(profile)
         info.setAlignment(Qt.AlignCenter)
         info.setWordWrap(True)  # ✅ makes text wrap nicely
         info.setStyleSheet("font-size: 15px; color: #cfcfcf; line-height: 1.4;")
@@ -88,6 +130,13 @@ class GameRunningDialog(QDialog):
             }
         """)
 
+    def set_profile(self, profile: str):
+        """Show which game profile is running (the dialog is reused)."""
+        if profile == self._profile:
+            return
+        self._profile = profile
+        self._info_label.setText(_GAME_INFO_HTML_PREFIX + profile + _GAME_INFO_HTML_SUFFIX)
+
 
 class MainWindow(QMainWindow):
     def __init__(self):
@@ -100,16 +149,29 @@ class MainWindow(QMainWindow):
 
         # Test process tracking
         self._test_process = None
-        self._test_timer = None
+
+        # "Game running" dialog, created on first game start and reused
+        self._game_dialog = None
+
+        # (recognizer name, key map) the help page currently shows
+        self._help_key = None
 
         # Gesture control for UI navigation (no camera window shown)
+        # Emissions are queued onto the UI thread and coalesced so that at
+        # most one action is applied per event-loop pass
+        self._pending_action = None
+        self._action_dispatch_scheduled = False
         self.ui_worker = UIGestureWorker()
-        self.ui_worker.action_signal.connect(self.on_ui_gesture)
+        self.ui_worker.action_signal.connect(self._queue_ui_gesture, Qt.QueuedConnection)
         self.ui_worker.start()
 
         # Disable UI gestures when popup is open
         self.ui_nav_enabled = True
 
+        # Build all pages with repaints off; the single window stylesheet
+        # below then styles the whole tree in one polish pass
+        self.setUpdatesEnabled(False)
+
         # Stacked pages
         self.stack = QStackedWidget()
         self.setCentralWidget(self.stack)
@@ -126,8 +188,30 @@ class MainWindow(QMainWindow):
 
         self.stack.setCurrentWidget(self.page_menu)
 
-        # Hover selection index
+        # Navigable buttons per page, in gesture order
+        self._buttons_for = {
+            self.page_menu: (
+                self.btn_play, self.btn_test, self.btn_settings, self.btn_help, self.btn_quit,
+            ),
+            self.page_play: (self.btn_subway, self.btn_temple, self.btn_back),
+            self.page_help: (self.btn_help_back,),
+            self.page_settings: (
+                self.btn_recognizer_mp, self.btn_recognizer_hybrid, self.btn_settings_back,
+            ),
+        }
+
+        # Hover selection index, and the button currently marked selected
         self.hover_index = 0
+        self._hovered_button = None
+
+        # Releases the simulated gesture press on _pressed_button. A coarse
+        # timer may fire up to 5% late (or on a 15.6 ms tick on Windows),
+        # which makes the press feel uneven; the precise one keeps it at 130 ms
+        self._press_timer = QTimer(self)
+        self._press_timer.setSingleShot(True)
+        self._press_timer.setTimerType(Qt.PreciseTimer)
+        self._press_timer.timeout.connect(self._release_pressed)
+        self._pressed_button = None
 
         # Global Styling
         self.setStyleSheet("""
@@ -152,8 +236,33 @@ class MainWindow(QMainWindow):
                 color: #101010;
                 border: 2px solid #00ff00;
             }
+            /* Gesture hover selection and gesture click */
+            QPushButton[selected="true"] {
+                background: rgba(32,32,32,0.92);
+                border: 2px solid #00ff00;
+                font-weight: 900;
+            }
+            QPushButton[pressed="true"] {
+                background: #00c853;
+                color: #101010;
+                border: 2px solid #00ff00;
+                font-weight: 900;
+            }
+
+            QLabel#menuTitle { font-size: 46px; font-weight: 950; }
+            QLabel#playTitle { font-size: 40px; font-weight: 950; }
+            QLabel#pageTitle { font-size: 42px; font-weight: 950; }
+            QLabel#menuSubtitle { font-size: 16px; color: #bdbdbd; }
+            QLabel#playSubtitle { font-size: 15px; color: #bdbdbd; }
+            QLabel#settingsSubtitle { font-size: 18px; color: #bdbdbd; }
+            QLabel#menuHint { font-size: 13px; color: #a5a5a5; margin-top: 26px; }
+            QLabel#helpInfo { font-size: 16px; color: #d2d2d2; line-height: 1.4; }
+            QLabel#currentRecognizer { font-size: 14px; color: #00c853; }
+            QLabel#recognizerDesc { font-size: 12px; color: #888888; }
         """)
 
+        self.setUpdatesEnabled(True)
+
         self.update_hover()
 
     # ---------------- UI HELPERS ----------------
@@ -164,31 +273,37 @@ class MainWindow(QMainWindow):
         b.setMinimumHeight(66)
         b.setCursor(Qt.PointingHandCursor)
         b.setFocusPolicy(Qt.NoFocus)
+        b.setProperty("selected", False)
+        b.setProperty("pressed", False)
         return b
 
+    @staticmethod
+    def _set_button_state(button: QPushButton, name: str, value: bool):
+        """Flip a gesture state property and re-polish just this button."""
+        button.setProperty(name, value)
+        style = button.style()
+        style.unpolish(button)
+        style.polish(button)
+
     def _simulate_press_and_click(self, button: QPushButton):
         """
         ✅ Shows the pressed UI even for gesture "SPACE"
         """
-        button.setProperty("gesturePressed", True)
-        button.setStyleSheet(button.styleSheet() + """
-            QPushButton[gesturePressed="true"] {
-                background: #00c853;
-                color: #101010;
-                border: 2px solid #00ff00;
-            }
-        """)
-        button.style().unpolish(button)
-        button.style().polish(button)
+        # One press at a time: a second click gesture while a button still
+        # looks pressed would otherwise click twice
+        if self._press_timer.isActive():
+            return
+
+        self._set_button_state(button, "pressed", True)
+        self._pressed_button = button
 
         # Release after short time + click
-        def release():
-            button.setProperty("gesturePressed", False)
-            button.style().unpolish(button)
-            button.style().polish(button)
-            button.click()
+        self._press_timer.start(130)
 
-        QTimer.singleShot(130, release)
+    def _release_pressed(self):
+        button, self._pressed_button = self._pressed_button, None
+        self._set_button_state(button, "pressed", False)
+        button.click()
 
     # ---------------- UI BUILDERS ----------------
 
@@ -200,11 +315,11 @@ class MainWindow(QMainWindow):
         layout.setSpacing(18)
 
         title = QLabel("Gesture Recognition Game")
-        title.setStyleSheet("font-size: 46px; font-weight: 950;")
+        title.setObjectName("menuTitle")
         title.setAlignment(Qt.AlignCenter)
 
         subtitle = QLabel("Use hand gestures to control the menu")
-        subtitle.setStyleSheet("font-size: 16px; color: #bdbdbd;")
+        subtitle.setObjectName("menuSubtitle")
         subtitle.setAlignment(Qt.AlignCenter)
 
         self.btn_play = self._make_button("Play Game")
@@ -230,7 +345,7 @@ class MainWindow(QMainWindow):
         layout.addWidget(self.btn_quit, alignment=Qt.AlignCenter)
 
         hint = QLabel("Closed Fist (👊) = Move   |   Thumb Up (👍) = Select")
-        hint.setStyleSheet("font-size: 13px; color: #a5a5a5; margin-top: 26px;")
+        hint.setObjectName("menuHint")
         hint.setAlignment(Qt.AlignCenter)
         layout.addWidget(hint)
 
@@ -244,19 +359,19 @@ class MainWindow(QMainWindow):
         layout.setSpacing(18)
 
         title = QLabel("Choose a Game")
-        title.setStyleSheet("font-size: 40px; font-weight: 950;")
+        title.setObjectName("playTitle")
         title.setAlignment(Qt.AlignCenter)
 
         subtitle = QLabel("Selecting a game opens it and enables gestures automatically")
-        subtitle.setStyleSheet("font-size: 15px; color: #bdbdbd;")
+        subtitle.setObjectName("playSubtitle")
         subtitle.setAlignment(Qt.AlignCenter)
 
         self.btn_subway = self._make_button("🚇  Subway Surfers", width=460)
         self.btn_temple = self._make_button("🏃  Temple Run 2", width=460)
         self.btn_back = self._make_button("Back", width=460)
 
-        self.btn_subway.clicked.connect(lambda: self.start_game("Subway Surfers", SUBWAY_URL))
-        self.btn_temple.clicked.connect(lambda: self.start_game("Temple Run", TEMPLE_URL))
+        self.btn_subway.clicked.connect(self._start_subway)
+        self.btn_temple.clicked.connect(self._start_temple)
         self.btn_back.clicked.connect(self.goto_menu)
 
         layout.addWidget(title)
@@ -278,7 +393,7 @@ class MainWindow(QMainWindow):
         layout.setSpacing(18)
 
         title = QLabel("Help")
-        title.setStyleSheet("font-size: 42px; font-weight: 950;")
+        title.setObjectName("pageTitle")
         title.setAlignment(Qt.AlignCenter)
 
         # Info label - will be updated dynamically when navigating to help
@@ -286,7 +401,7 @@ class MainWindow(QMainWindow):
         self._update_help_gestures()
         self.help_info_label.setAlignment(Qt.AlignCenter)
         self.help_info_label.setWordWrap(True)
-        self.help_info_label.setStyleSheet("font-size: 16px; color: #d2d2d2; line-height: 1.4;")
+        self.help_info_label.setObjectName("helpInfo")
 
         self.btn_help_back = self._make_button("⬅  Back", width=520)
         self.btn_help_back.clicked.connect(self.goto_menu)
@@ -300,49 +415,21 @@ class MainWindow(QMainWindow):
 
     def _update_help_gestures(self):
         """Update the help page gesture mappings from the current recognizer."""
-        gesture_emojis = {
-            "Victory": "✌️",
-            "ILoveYou": "🤟",
-            "Pointing_Up": "☝️",
-            "Closed_Fist": "✊",
-            "Thumb_Up": "👍",
-            "Thumb_Down": "👎",
-            "Open_Palm": "🖐️",
-            "FIST": "✊",
-            "ONE FINGER": "☝️",
-            "THUMB UP": "👍",
-            "INDEX LEFT": "👈",
-            "INDEX RIGHT": "👉",
-            "OPEN PALM": "🖐️",
-        }
-        
         recognizer = get_recognizer()
         key_map = recognizer.keyMap
-        recognizer_name = recognizer.name
-        
-        gesture_lines = ""
-        for gesture, action in key_map.items():
-            emoji = gesture_emojis.get(gesture, "🤚")
-            gesture_lines += f"{emoji} {gesture} → {action}<br>"
-
-        self.help_info_label.setText(
-            f"""
-            <b>Launcher controls</b><br>
-            
-            👊 Closed Fist → Move through buttons<br>
-            👍 Thumb Up → Select / Click<br><br>
-
-            <b>Game gestures</b> ({recognizer_name})<br>
-            
-            {gesture_lines}<br>
-
-            <b>Tips</b><br>
-            
-            Keep the browser window focused<br>
-            Better lighting = better detection<br>
-            Stay close enough so your hand is visible
-            """
+
+        # Rich text is re-parsed on every setText; only rebuild it when the
+        # recognizer or its mappings changed
+        key = (recognizer.name, tuple(key_map.items()))
+        if key == self._help_key:
+            return
+        self._help_key = key
+
+        gesture_lines = "".join(
+            f"{_GESTURE_EMOJIS.get(gesture, '🤚')} {gesture} → {action}<br>"
+            for gesture, action in key_map.items()
         )
+        self.help_info_label.setText(_HELP_HTML % (recognizer.name, gesture_lines))
 
     def build_settings_page(self):
         page = QWidget()
@@ -352,33 +439,33 @@ class MainWindow(QMainWindow):
         layout.setSpacing(18)
 
         title = QLabel("Settings")
-        title.setStyleSheet("font-size: 42px; font-weight: 950;")
+        title.setObjectName("pageTitle")
         title.setAlignment(Qt.AlignCenter)
 
         subtitle = QLabel("Choose Gesture Recognizer Model")
-        subtitle.setStyleSheet("font-size: 18px; color: #bdbdbd;")
+        subtitle.setObjectName("settingsSubtitle")
         subtitle.setAlignment(Qt.AlignCenter)
 
         # Current recognizer label
         self.lbl_current_recognizer = QLabel()
         self._update_recognizer_label()
-        self.lbl_current_recognizer.setStyleSheet("font-size: 14px; color: #00c853;")
+        self.lbl_current_recognizer.setObjectName("currentRecognizer")
         self.lbl_current_recognizer.setAlignment(Qt.AlignCenter)
 
         # MediaPipe Tasks button
         self.btn_recognizer_mp = self._make_button("🎯 MediaPipe Tasks (Default)", width=520)
-        self.btn_recognizer_mp.clicked.connect(lambda: self.switch_recognizer(RecognizerType.MEDIAPIPE_TASKS))
+        self.btn_recognizer_mp.clicked.connect(self._use_mediapipe_recognizer)
 
         mp_desc = QLabel("Pre-trained model for gesture recognition.\nBest for: Victory, ILoveYou, Pointing Up, Fist, Thumb Up")
-        mp_desc.setStyleSheet("font-size: 12px; color: #888888;")
+        mp_desc.setObjectName("recognizerDesc")
         mp_desc.setAlignment(Qt.AlignCenter)
 
         # Hybrid Pose button
         self.btn_recognizer_hybrid = self._make_button("🖐️ Hybrid Pose-Based", width=520)
-        self.btn_recognizer_hybrid.clicked.connect(lambda: self.switch_recognizer(RecognizerType.HYBRID_POSE))
+        self.btn_recognizer_hybrid.clicked.connect(self._use_hybrid_recognizer)
 
         hybrid_desc = QLabel("Finger position tracking with motion detection.\nBest for: Motion-based gestures like swiping")
-        hybrid_desc.setStyleSheet("font-size: 12px; color: #888888;")
+        hybrid_desc.setObjectName("recognizerDesc")
         hybrid_desc.setAlignment(Qt.AlignCenter)
 
         # Back button
@@ -428,6 +515,12 @@ class MainWindow(QMainWindow):
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to switch recognizer:\n{e}")
 
+    def _use_mediapipe_recognizer(self):
+        self.switch_recognizer(RecognizerType.MEDIAPIPE_TASKS)
+
+    def _use_hybrid_recognizer(self):
+        self.switch_recognizer(RecognizerType.HYBRID_POSE)
+
     def goto_settings(self):
         self.stack.setCurrentWidget(self.page_settings)
         self.hover_index = 0
@@ -436,16 +529,7 @@ class MainWindow(QMainWindow):
     # ---------------- HOVER SYSTEM ----------------
 
     def current_buttons(self):
-        page = self.stack.currentWidget()
-        if page == self.page_menu:
-            return [self.btn_play, self.btn_test, self.btn_settings, self.btn_help, self.btn_quit]
-        if page == self.page_play:
-            return [self.btn_subway, self.btn_temple, self.btn_back]
-        if page == self.page_help:
-            return [self.btn_help_back]
-        if page == self.page_settings:
-            return [self.btn_recognizer_mp, self.btn_recognizer_hybrid, self.btn_settings_back]
-        return []
+        return self._buttons_for.get(self.stack.currentWidget(), ())
 
     def update_hover(self):
         buttons = self.current_buttons()
@@ -453,42 +537,17 @@ class MainWindow(QMainWindow):
             return
 
         self.hover_index %= len(buttons)
+        hovered = buttons[self.hover_index]
 
-        for i, b in enumerate(buttons):
-            if i == self.hover_index:
-                b.setStyleSheet("""
-                    QPushButton {
-                        background: rgba(32,32,32,0.92);
-                        color: white;
-                        border: 2px solid #00ff00;
-                        border-radius: 20px;
-                        font-size: 18px;
-                        font-weight: 900;
-                        padding: 16px;
-                    }
-                    QPushButton:pressed {
-                        background: #00c853;
-                        color: #101010;
-                        border: 2px solid #00ff00;
-                    }
-                """)
-            else:
-                b.setStyleSheet("""
-                    QPushButton {
-                        background: rgba(32,32,32,0.92);
-                        color: white;
-                        border: 1px solid rgba(255,255,255,0.16);
-                        border-radius: 20px;
-                        font-size: 18px;
-                        font-weight: 800;
-                        padding: 16px;
-                    }
-                    QPushButton:pressed {
-                        background: #00c853;
-                        color: #101010;
-                        border: 2px solid #00ff00;
-                    }
-                """)
+        # Only the previously hovered and the newly hovered button change;
+        # re-polishing every button would redo widgets that look the same
+        prev = self._hovered_button
+        if prev is hovered:
+            return
+        if prev is not None:
+            self._set_button_state(prev, "selected", False)
+        self._set_button_state(hovered, "selected", True)
+        self._hovered_button = hovered
 
     def hover_next(self):
         self.hover_index += 1
@@ -502,6 +561,19 @@ class MainWindow(QMainWindow):
 
     # ---------------- GESTURE HANDLING ----------------
 
+    def _queue_ui_gesture(self, action: str):
+        """Keep only the latest action until the event loop gets to it."""
+        self._pending_action = action
+        if not self._action_dispatch_scheduled:
+            self._action_dispatch_scheduled = True
+            QTimer.singleShot(0, self._flush_ui_gesture)
+
+    def _flush_ui_gesture(self):
+        action, self._pending_action = self._pending_action, None
+        self._action_dispatch_scheduled = False
+        if action is not None:
+            self.on_ui_gesture(action)
+
     def on_ui_gesture(self, action: str):
         """
         ✅ Closed_Fist -> Move selection
@@ -544,19 +616,29 @@ class MainWindow(QMainWindow):
         ✅ Popup disables app gestures while open
         """
         self.stop_game_worker()
-        webbrowser.open(url)
+        # Hands off to the platform URL handler without blocking the UI thread
+        QDesktopServices.openUrl(QUrl(url))
 
         self.game_worker = GestureBackgroundWorker(profile=profile)
         self.game_worker.start()
 
         # disable launcher gestures while popup is open
         self.ui_nav_enabled = False
-        dialog = GameRunningDialog(profile, self)
-        dialog.exec()
+        if self._game_dialog is None:
+            self._game_dialog = GameRunningDialog(profile, self)
+        else:
+            self._game_dialog.set_profile(profile)
+        self._game_dialog.exec()
         self.ui_nav_enabled = True
 
         self.goto_menu()
 
+    def _start_subway(self):
+        self.start_game("Subway Surfers", SUBWAY_URL)
+
+    def _start_temple(self):
+        self.start_game("Temple Run", TEMPLE_URL)
+
     def stop_game_worker(self):
         if self.game_worker and self.game_worker.isRunning():
             self.game_worker.stop()
@@ -566,7 +648,7 @@ class MainWindow(QMainWindow):
     # ---------------- TEST ----------------
 
     def launch_test_controller(self):
-        import subprocess, os
+        import os
 
         # Get leon_version directory (parent of app/)
         base_dir = os.path.dirname(os.path.abspath(__file__))
@@ -576,38 +658,42 @@ class MainWindow(QMainWindow):
         current_type = RecognizerSingleton.get_current_type()
         recognizer_arg = current_type.value if current_type else "MEDIAPIPE_TASKS"
 
-        try:
-            # Minimize the main window while testing
-            self.showMinimized()
-            
-            # Run test with recognizer type argument
-            process = subprocess.Popen(
-                [sys.executable, "-m", "app.gesture_test", recognizer_arg],
-                cwd=leon_version_dir
-            )
-            
-            # Start a timer to check when the process exits
-            self._test_process = process
-            self._test_timer = QTimer()
-            self._test_timer.timeout.connect(self._check_test_process)
-            self._test_timer.start(200)  # Check every 200ms
-            
-        except Exception as e:
-            self.showNormal()
-            self.activateWindow()
-            QMessageBox.critical(self, "Error", f"Could not run gesture_test.py:\n{e}")
-
-    def _check_test_process(self):
-        """Check if the test process has exited and restore the main window."""
-        if self._test_process and self._test_process.poll() is not None:
-            # Process has exited
-            self._test_timer.stop()
+        # Minimize the main window while testing
+        self.showMinimized()
+
+        # QProcess reports the exit through the event loop, no polling needed
+        process = QProcess(self)
+        process.setWorkingDirectory(leon_version_dir)
+        process.setProcessChannelMode(QProcess.ForwardedChannels)
+        process.finished.connect(self._on_test_finished)
+        process.errorOccurred.connect(self._on_test_error)
+        self._test_process = process
+
+        # Run test with recognizer type argument
+        process.start(sys.executable, ["-m", "app.gesture_test", recognizer_arg])
+
+    def _restore_window(self):
+        self.showNormal()
+        self.raise_()
+        self.activateWindow()
+
+    def _on_test_finished(self, exit_code, exit_status):
+        """Restore the main window once the test process has exited."""
+        if self._test_process is not None:
+            self._test_process.deleteLater()
             self._test_process = None
-            
-            # Restore and focus the main window
-            self.showNormal()
-            self.raise_()
-            self.activateWindow()
+        self._restore_window()
+
+    def _on_test_error(self, error):
+        if error != QProcess.FailedToStart:
+            return
+        process = self._test_process
+        message = process.errorString() if process else str(error)
+        if process is not None:
+            process.deleteLater()
+        self._test_process = None
+        self._restore_window()
+        QMessageBox.critical(self, "Error", f"Could not run gesture_test.py:\n{message}")
 
     # ---------------- CLOSE ----------------
 
@@ -622,10 +708,22 @@ class MainWindow(QMainWindow):
 
 
 def main():
-    app = QApplication(sys.argv)
-    w = MainWindow()
-    w.show()
-    sys.exit(app.exec())
+    # Windows schedules timers and thread waits on a ~15.6 ms tick by
+    # default; raise it to 1 ms while the launcher runs so Qt's precise
+    # timers and the gesture workers' waits keep their cadence
+    winmm = ctypes.windll.winmm if sys.platform == "win32" else None
+    if winmm is not None:
+        winmm.timeBeginPeriod(1)
+
+    try:
+        app = QApplication(sys.argv)
+        w = MainWindow()
+        w.show()
+        code = app.exec()
+    finally:
+        if winmm is not None:
+            winmm.timeEndPeriod(1)
+    sys.exit(code)
 
 
 if __name__ == "__main__":
@@ -1,4 +1,58 @@
+from functools import lru_cache
+
 import cv2
+import numpy as np
+
+from app.core.image_ops import draw_hand_skeleton as _draw_skeleton
+
+
+# Test UI skeleton: red lines, uniform green points
+_SKELETON_POINT_COLORS = ((0, 255, 0),) * 21
+_SKELETON_POINT_RADII = (5,) * 21
+
+
+# Info panel layout (top-left), fonts and colors
+_PANEL_X1, _PANEL_Y1 = 15, 15
+_PANEL_X2, _PANEL_Y2 = 420, 140
+_PANEL_SHAPE = (_PANEL_Y2 - _PANEL_Y1 + 1, _PANEL_X2 - _PANEL_X1 + 1, 3)
+# Text anchors, relative to the panel's top-left corner
+_POS_ACTION = (12, 40)
+_POS_MODEL = (12, 75)
+# The perf line changes every frame and is drawn straight onto the frame
+_POS_PERF = (_PANEL_X1 + 12, _PANEL_Y1 + 110)
+_FONT_DUPLEX = cv2.FONT_HERSHEY_DUPLEX
+_FONT_SIMPLEX = cv2.FONT_HERSHEY_SIMPLEX
+_COLOR_ACTIVE = (0, 255, 0)
+_COLOR_IDLE = (170, 170, 170)
+_COLOR_MODEL = (220, 220, 220)
+_COLOR_PERF = (200, 200, 200)
+_COLOR_HINT = (1, 1, 1)
+
+# Solid panel color images, keyed by ROI shape
+_panel_fills = {}
+
+
+def _panel_fill(shape):
+    fill = _panel_fills.get(shape)
+    if fill is None:
+        fill = _panel_fills[shape] = np.full(shape, 40, dtype=np.uint8)
+    return fill
+
+
+@lru_cache(maxsize=64)
+def _panel_text(action_text, model_text, action_color):
+    """
+    Rasterize the action and model lines once per distinct content.
+
+    Returns (layer, mask): the text pixels and where they are. Text is
+    drawn without anti-aliasing, so copying it through the mask onto the
+    blended panel gives the same pixels as drawing it there directly.
+    """
+    layer = np.zeros(_PANEL_SHAPE, dtype=np.uint8)
+    cv2.putText(layer, action_text, _POS_ACTION, _FONT_DUPLEX, 1.0, action_color, 2)
+    cv2.putText(layer, model_text, _POS_MODEL, _FONT_SIMPLEX, 0.65, _COLOR_MODEL, 2)
+    mask = layer.any(axis=2, keepdims=True)
+    return layer, mask
 
 
 def draw_ui(frame, action, raw_label, score, fps, latency_ms, enabled):
@@ -9,73 +63,45 @@ def draw_ui(frame, action, raw_label, score, fps, latency_ms, enabled):
     - FPS + latency
     (No profiles box, no control status, no space toggle text)
     """
-    overlay = frame.copy()
+    # Small panel top-left, blended in place over its ROI only
+    roi = frame[_PANEL_Y1:_PANEL_Y2 + 1, _PANEL_X1:_PANEL_X2 + 1]
+    cv2.addWeighted(_panel_fill(roi.shape), 0.65, roi, 0.35, 0, dst=roi)
 
-    # Small panel top-left
-    x1, y1 = 15, 15
-    x2, y2 = 420, 140
-    cv2.rectangle(overlay, (x1, y1), (x2, y2), (40, 40, 40), -1)
-    frame = cv2.addWeighted(overlay, 0.65, frame, 0.35, 0)
+    # Action (big) and model label + score. These change far less often
+    # than frames arrive, so they are rendered once per distinct content
+    # and composited through their mask.
+    action_color = _COLOR_ACTIVE if action != "IDLE" else _COLOR_IDLE
+    model_text = "Model: None" if not raw_label else "Model: %s (%.2f)" % (raw_label, score)
+    layer, mask = _panel_text("Action: " + action, model_text, action_color)
 
-    # Action (big)
-    action_color = (0, 255, 0) if action != "IDLE" else (170, 170, 170)
-    cv2.putText(frame, f"Action: {action}", (x1 + 12, y1 + 40),
-                cv2.FONT_HERSHEY_DUPLEX, 1.0, action_color, 2)
+    rh, rw = roi.shape[:2]
+    np.copyto(roi, layer[:rh, :rw], where=mask[:rh, :rw])
 
-    # Model label
-    model_text = "None" if not raw_label else f"{raw_label} ({score:.2f})"
-    cv2.putText(frame, f"Model: {model_text}", (x1 + 12, y1 + 75),
-                cv2.FONT_HERSHEY_SIMPLEX, 0.65, (220, 220, 220), 2)
-
-    # Performance line
-    cv2.putText(frame, f"FPS: {fps:.1f} | Latency: {latency_ms:.0f}ms", (x1 + 12, y1 + 110),
-                cv2.FONT_HERSHEY_SIMPLEX, 0.58, (200, 200, 200), 2)
+    # Performance line: different nearly every frame, so never cached
+    perf_text = "FPS: %.1f | Latency: %.0fms" % (fps, latency_ms)
+    cv2.putText(frame, perf_text, _POS_PERF, _FONT_SIMPLEX, 0.58, _COLOR_PERF, 2)
 
     # ✅ Bottom-left hint
-    h, w = frame.shape[:2]
     cv2.putText(
         frame,
         "[Q] = Quit",
-        (15, h - 15),
-        cv2.FONT_HERSHEY_SIMPLEX,
+        (15, frame.shape[0] - 15),
+        _FONT_SIMPLEX,
         0.55,
-        (1, 1, 1),
+        _COLOR_HINT,
         2,
     )
 
     return frame
 
 
-def draw_hand_skeleton(frame, landmarks):
+def draw_hand_skeleton(frame, landmarks, mirror=False):
     """
     Draw MediaPipe hand skeleton lines + points.
-    landmarks: list of mediapipe normalized landmarks (x,y)
+    landmarks: list of mediapipe normalized landmarks (x,y), or a (21, 3)
+               array of normalized x, y, z
+    mirror: flip landmark x to match a horizontally flipped frame
     """
-    h, w = frame.shape[:2]
-
-    # Standard MediaPipe hand connections
-    connections = [
-        (0, 1), (1, 2), (2, 3), (3, 4),       # thumb
-        (0, 5), (5, 6), (6, 7), (7, 8),       # index
-        (0, 9), (9, 10), (10, 11), (11, 12),  # middle
-        (0, 13), (13, 14), (14, 15), (15, 16),# ring
-        (0, 17), (17, 18), (18, 19), (19, 20),# pinky
-        (5, 9), (9, 13), (13, 17)             # palm
-    ]
-
-    # Convert to pixel coords
-    pts = []
-    for lm in landmarks:
-        x = int(lm.x * w)
-        y = int(lm.y * h)
-        pts.append((x, y))
-
-    # Draw lines
-    for a, b in connections:
-        cv2.line(frame, pts[a], pts[b], (0, 0, 255), 2)
-
-    # Draw points
-    for (x, y) in pts:
-        cv2.circle(frame, (x, y), 5, (0, 255, 0), -1)
-
-    return frame
+    return _draw_skeleton(
+        frame, landmarks, mirror, (0, 0, 255), _SKELETON_POINT_COLORS, _SKELETON_POINT_RADII
+    )